@@ -1,94 +1,391 @@
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.express as px
-import plotly.figure_factory as ff
+import pyarrow.feather as feather
+
+from data import DATA_FILE, box_stats, box_traces, load_survey
 
 # --- CONSTANTS ---
-DATA_FILE = "Students_Performance_data_set.csv"
+CORRELATION_COLS = ('Study Hours per Day', 'Attendance_numeric', 'Study Sessions per Day', 'CGPA')
+# Pre-cleaned Arrow IPC (Feather v2) snapshot, rebuilt whenever DATA_FILE is newer.
+# Bump the version whenever clean_data or the snapshot dtypes change, so an
+# older snapshot is never read back with the wrong columns
+CLEAN_SNAPSHOT_VERSION = 1
+CLEAN_DATA_FILE = f"students_clean.v{CLEAN_SNAPSHOT_VERSION}.feather"
+ALL_CATEGORIES = frozenset({'attendance', 'social', 'income'})
 
 # --- UTILITY FUNCTION: DATA LOADING AND CLEANING ---
 
-@st.cache_data
-def load_and_clean_data(file_path):
-    """Loads, renames, cleans, and prepares the student performance data."""
-    try:
-        # Load the dataset (try common encodings)
-        df = pd.read_csv(file_path, encoding='utf-8')
-    except UnicodeDecodeError:
-        try:
-            df = pd.read_csv(file_path, encoding='latin1')
-        except UnicodeDecodeError:
-            df = pd.read_csv(file_path, encoding='cp1252')
-            
-    # Define a dictionary for renaming relevant columns
-    column_rename_map = {
-        'What is your current CGPA?': 'CGPA',
-        'Gender': 'Gender',
-        'How many hour do you study daily?': 'Study Hours per Day',
-        'How many times do you seat for study in a day?': 'Study Sessions per Day',
-        'Average attendance on class': 'Attendance',
-        'How many hour do you spent daily in social media?': 'Social Media Hours',
-        'Do you have meritorious scholarship ?': 'Scholarship Status',
-        'What is your monthly family income?': 'Family Income'
-    }
+# Columns of the shared survey frame used by the three pages
+PAGE_COLUMNS = [
+    'CGPA', 'Gender', 'Study Hours per Day', 'Study Sessions per Day', 'Attendance',
+    'Social Media Hours', 'Scholarship Status', 'Family Income'
+]
+
+def load_raw_data(file_path):
+    """Selects the page columns from the shared survey frame (see data.py)."""
+    df = load_survey(file_path)
+    # Explicit copy: the cleaning steps assign columns, and pandas 2 flags a bare
+    # selection of the shared frame with SettingWithCopyWarning
+    return df[[col for col in PAGE_COLUMNS if col in df.columns]].copy()
+
+def fast_bin(series, bins, labels):
+    """
+    Bins a numeric series like pd.cut(right=True, include_lowest=True), but with
+    np.searchsorted on the raw values. Missing or out-of-range values get the modal bin.
+    """
+    vals = series.to_numpy(dtype=float)
+    codes = np.searchsorted(np.asarray(bins[1:-1], dtype=float), vals, side='left')
+    missing = np.isnan(vals) | (vals < bins[0]) | (vals > bins[-1])
+    # Mode straight from the codes: one bincount pass, no value_counts sort
+    valid = codes[~missing]
+    codes[missing] = np.bincount(valid, minlength=len(labels)).argmax() if valid.size else 0
+    # Ordered, so groupby output and charts follow the bin order without category_orders
+    return pd.Series(pd.Categorical.from_codes(codes, categories=labels, ordered=True), index=series.index)
+
+def group_mean(df, by, val):
+    """Mean of `val` for each observed group of `by`, returned as a two-column frame."""
+    return df.groupby(by, observed=True)[val].mean().reset_index()
+
+def clean_snapshot_is_fresh(file_path):
+    """Checks whether the cleaned snapshot exists and is newer than the raw CSV."""
+    return (
+        os.path.exists(CLEAN_DATA_FILE)
+        and os.path.getmtime(CLEAN_DATA_FILE) >= os.path.getmtime(file_path)
+    )
 
-    # Rename columns if they exist
-    df.rename(columns=column_rename_map, inplace=True)
+def clean_data(file_path, needed=frozenset()):
+    """
+    Cleans the raw data and builds only the categorical columns a page asks for.
+    `needed` may contain "attendance", "social" and/or "income".
+    """
+    df = load_raw_data(file_path)
 
     # --- Data Cleaning and Categorization ---
 
+    # The three bin passes are independent, so they are collected as
+    # (column, values, bins, labels) tasks and run together below
+    bin_tasks = []
+    # Upper bin edges of the open-ended bins, from one reduction over both columns
+    col_max = df[[col for col in ('Social Media Hours', 'Family Income') if col in df.columns]].max(numeric_only=True)
+
     # 1. Attendance: Convert to numeric and categorize (Objective 2)
-    if 'Attendance' in df.columns:
+    if 'attendance' in needed and 'Attendance' in df.columns:
+        # data.py parses the survey text as str (Arrow-backed on pandas 3, object on
+        # pandas 2); either way only non-text columns need the astype(str) copy, and
+        # the replace is a literal, not a regex
+        attendance = df['Attendance']
+        if not pd.api.types.is_string_dtype(attendance):
+            attendance = attendance.astype(str)
+        df['Attendance_numeric'] = pd.to_numeric(
+            attendance.str.replace('%', '', regex=False), errors='coerce'
+        )
         df['Attendance_numeric'] = pd.to_numeric(
-            df['Attendance'].astype(str).str.replace('%', ''), errors='coerce'
+            df['Attendance_numeric'].fillna(df['Attendance_numeric'].mean()), downcast='float'
         )
-        if df['Attendance_numeric'].isnull().any():
-            df['Attendance_numeric'].fillna(df['Attendance_numeric'].mean(), inplace=True)
             
         bins = [0, 70, 85, 100]
         labels = ['Low (<=70%)', 'Medium (71-85%)', 'High (>85%)']
-        df['Attendance_Category'] = pd.cut(
-            df['Attendance_numeric'], bins=bins, labels=labels, right=True, include_lowest=True
-        )
-        # Handle potential NaNs after cut by filling with the mode and ensuring it's a category
-        df['Attendance_Category'] = df['Attendance_Category'].astype(str).replace('nan', df['Attendance_Category'].mode()[0]).astype('category')
+        bin_tasks.append(('Attendance_Category', df['Attendance_numeric'], bins, labels))
 
 
     # 2. Social Media Hours: Categorize (Objective 3)
-    if 'Social Media Hours' in df.columns and np.issubdtype(df['Social Media Hours'].dtype, np.number):
-        bins = [-1, 0, 2, 5, df['Social Media Hours'].max() + 1] 
+    if 'social' in needed and 'Social Media Hours' in df.columns and np.issubdtype(df['Social Media Hours'].dtype, np.number):
+        bins = [-1, 0, 2, 5, col_max['Social Media Hours'] + 1]
         labels = ['0 hours', '1-2 hours', '3-5 hours', '>5 hours']
-        df['Social Media Category'] = pd.cut(
-            df['Social Media Hours'], bins=bins, labels=labels, right=True, include_lowest=True
-        )
-        df['Social Media Category'] = df['Social Media Category'].astype(str).replace('nan', df['Social Media Category'].mode()[0]).astype('category')
+        bin_tasks.append(('Social Media Category', df['Social Media Hours'], bins, labels))
 
 
     # 3. Family Income: Categorize (Objective 3)
-    if 'Family Income' in df.columns and np.issubdtype(df['Family Income'].dtype, np.number):
-        bins = [0, 50000, 150000, df['Family Income'].max() + 1]
+    if 'income' in needed and 'Family Income' in df.columns and np.issubdtype(df['Family Income'].dtype, np.number):
+        bins = [0, 50000, 150000, col_max['Family Income'] + 1]
         labels = ['Low Income', 'Medium Income', 'High Income'] 
-        df['Family Income Category'] = pd.cut(
-            df['Family Income'], bins=bins, labels=labels, right=True, include_lowest=True
-        )
-        df['Family Income Category'] = df['Family Income Category'].astype(str).replace('nan', df['Family Income Category'].mode()[0]).astype('category')
+        bin_tasks.append(('Family Income Category', df['Family Income'], bins, labels))
+
+    # np.searchsorted releases the GIL, so threads overlap the bin passes
+    if len(bin_tasks) > 1:
+        with ThreadPoolExecutor(max_workers=len(bin_tasks)) as pool:
+            binned = list(pool.map(lambda task: fast_bin(*task[1:]), bin_tasks))
+    else:
+        binned = [fast_bin(*task[1:]) for task in bin_tasks]
+    for (col, *_), values in zip(bin_tasks, binned):
+        df[col] = values
         
-    # 4. Fill missing values for core columns (CGPA, Gender) if any
-    for col in ['CGPA', 'Gender']:
-        if col in df.columns and df[col].isnull().any():
-            df[col].fillna(df[col].mode()[0] if df[col].dtype == 'object' else df[col].mean(), inplace=True)
+    # 4. Fill remaining missing values in one pass: mean for numeric columns, mode for the rest
+    na_cols = df.columns[df.isna().any()]
+    numeric_na_cols = df[na_cols].select_dtypes('number').columns
+    other_na_cols = na_cols.difference(numeric_na_cols)
+    fill_values = df[numeric_na_cols].mean().to_dict()
+    if len(other_na_cols):
+        fill_values.update(df[other_na_cols].mode().iloc[0].to_dict())
+    df = df.fillna(fill_values)
 
     return df
 
+# Low-cardinality text columns stored with a category dtype in the snapshot
+SNAPSHOT_CATEGORY_COLUMNS = [
+    'Gender', 'Scholarship Status',
+    'Attendance_Category', 'Social Media Category', 'Family Income Category'
+]
+
+def write_clean_snapshot(file_path):
+    """Cleans the data with every category column and writes it to CLEAN_DATA_FILE."""
+    df = clean_data(file_path, needed=ALL_CATEGORIES)
+    # Skip columns that are already categorical (astype('category') would drop their order)
+    df = df.astype({
+        col: 'category' for col in SNAPSHOT_CATEGORY_COLUMNS
+        if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype)
+    })
+    # Written to a temp file in the same directory and swapped in with os.replace,
+    # so sessions memory-mapping the snapshot never see a half-written file and
+    # concurrent cold starts cannot interleave their writes
+    fd, tmp_path = tempfile.mkstemp(suffix='.tmp', dir=os.path.dirname(os.path.abspath(CLEAN_DATA_FILE)))
+    os.close(fd)
+    try:
+        # Uncompressed so later reads can memory-map the file instead of decoding it
+        df.to_feather(tmp_path, compression='uncompressed')
+        os.replace(tmp_path, CLEAN_DATA_FILE)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return df
+
+@st.cache_data
+def load_and_clean_data(file_path, needed=frozenset(), columns=None):
+    """
+    Returns the cleaned data for a page, optionally restricted to `columns`.
+    Reads the cleaned snapshot, (re)building it first when DATA_FILE is newer,
+    so restarted workers skip the CSV parse and cleaning passes.
+    """
+    if not clean_snapshot_is_fresh(file_path):
+        try:
+            write_clean_snapshot(file_path)
+        except OSError:
+            # Read-only checkout: clean in memory instead
+            df = clean_data(file_path, needed)
+            if columns:
+                df = df[[col for col in columns if col in df.columns]]
+            return df
+
+    # Memory-mapped (zero-copy for the uncompressed file), then only the requested
+    # columns the snapshot has are converted; a missing one is left out, as in the
+    # in-memory branch, so has_columns reports False instead of the read raising
+    table = feather.read_table(CLEAN_DATA_FILE, memory_map=True)
+    if columns:
+        table = table.select([col for col in columns if col in table.column_names])
+    return table.to_pandas()
+
+@st.cache_data
+def has_columns(file_path, needed, required):
+    """
+    Schema check for a page, cached so a rerun gets back one bool instead of
+    unpickling a copy of the page's columns just to look at their names.
+    """
+    return set(required).issubset(load_and_clean_data(file_path, needed, tuple(required)).columns)
+
+# --- CACHED PAGE AGGREGATIONS ---
+# Small summary tables that only depend on the cleaned data, so page
+# switches become cache lookups instead of fresh groupby/corr passes.
+
+@st.cache_data
+def overview_aggs(file_path):
+    """CGPA histogram bins, gender counts and average CGPA by gender for Objective 1."""
+    df = load_and_clean_data(file_path, columns=('CGPA', 'Gender'))
+    gender_counts = df['Gender'].value_counts().reset_index()
+    gender_counts.columns = ['Gender', 'Count']
+    return {
+        'cgpa_hist': np.histogram(df['CGPA'].dropna().to_numpy(), bins=20),
+        'gender_counts': gender_counts,
+        'avg_cgpa_by_gender': group_mean(df, 'Gender', 'CGPA').sort_values(by='CGPA', ascending=False),
+    }
+
+def corr_matrix(df, cols):
+    """Pearson correlation of the given columns, computed in one np.corrcoef call."""
+    # One contiguous float32 block instead of pandas' pairwise column loop
+    arr = df[list(cols)].to_numpy(dtype=np.float32)
+    return np.corrcoef(arr, rowvar=False), list(cols)
+
+def trend_line(df, x_col, y_col):
+    """End points of the least-squares line of `y_col` on `x_col` (two points are enough to draw it)."""
+    x = df[x_col].to_numpy(dtype=np.float32)
+    y = df[y_col].to_numpy(dtype=np.float32)
+    slope, intercept = np.polyfit(x, y, 1)
+    xs = np.array([x.min(), x.max()])
+    return xs, slope * xs + intercept
+
+@st.cache_data
+def study_aggs(file_path, correlation_cols):
+    """Correlation matrix and CGPA box stats by attendance for Objective 2."""
+    df = load_and_clean_data(file_path, needed=frozenset({'attendance'}), columns=correlation_cols + ('Attendance_Category',))
+    return {
+        'corr_matrix': corr_matrix(df, correlation_cols),
+        'study_hours_trend': trend_line(df, 'Study Hours per Day', 'CGPA'),
+        'cgpa_box_by_attendance': box_stats(df, 'Attendance_Category', 'CGPA'),
+    }
+
+@st.cache_data
+def nonacad_aggs(file_path):
+    """Average CGPA by social media usage and CGPA box stats by income for Objective 3."""
+    df = load_and_clean_data(file_path, needed=frozenset({'social', 'income'}), columns=('Social Media Category', 'Family Income Category', 'CGPA'))
+    return {
+        'avg_cgpa_by_social_media': group_mean(df, 'Social Media Category', 'CGPA'),
+        'cgpa_box_by_income': box_stats(df, 'Family Income Category', 'CGPA'),
+    }
+
+# --- CACHED FIGURES ---
+# Figures only depend on the cached data, so they are built once and reused
+# by every rerun (cache_resource hands back the same Figure object).
+# Plotly is imported inside the builders, so the page shell and headings
+# render before the first figure pays for the import.
+
+@st.cache_resource
+def overview_figures(file_path):
+    """Builds the Objective 1 figures."""
+    import plotly.express as px
+    import plotly.graph_objects as go
+
+    aggs = overview_aggs(file_path)
+
+    # 1. CGPA Distribution (Histogram)
+    # Bins are computed server-side, so only 20 bars are sent to the browser
+    counts, edges = aggs['cgpa_hist']
+    fig_hist = go.Figure(go.Bar(
+        x=(edges[:-1] + edges[1:]) / 2,
+        y=counts,
+        width=np.diff(edges),
+        marker_color='#3178C6'
+    ))
+    fig_hist.update_layout(title='Distribution of Student CGPA', xaxis_title='CGPA', yaxis_title='Frequency', bargap=0)
+
+    # 2. Gender Distribution (Pie Chart)
+    fig_pie = px.pie(
+        aggs['gender_counts'],
+        names='Gender',
+        values='Count',
+        title='Gender Distribution',
+        color='Gender',
+        color_discrete_map={'Male': '#1f77b4', 'Female': '#2ca02c'}
+    )
+    fig_pie.update_traces(textposition='inside', textinfo='percent+label')
+
+    # 3. Average CGPA by Gender (Bar Chart)
+    fig_bar = px.bar(
+        aggs['avg_cgpa_by_gender'],
+        x='Gender',
+        y='CGPA',
+        title='Average CGPA by Gender',
+        color='Gender',
+        color_discrete_map={'Male': '#1f77b4', 'Female': '#2ca02c'},
+        text_auto='.2f'
+    )
+    fig_bar.update_layout(yaxis_title='Average CGPA')
+
+    return {'hist': fig_hist, 'pie': fig_pie, 'bar': fig_bar}
+
+@st.cache_resource
+def study_figures(file_path):
+    """Builds the Objective 2 figures."""
+    import plotly.express as px
+    import plotly.graph_objects as go
+
+    df = load_and_clean_data(file_path, needed=frozenset({'attendance'}), columns=('Study Hours per Day', 'CGPA'))
+    aggs = study_aggs(file_path, CORRELATION_COLS)
+
+    # 1. Scatter Plot: Study Hours per Day vs CGPA
+    fig_scatter = px.scatter(
+        df,
+        x='Study Hours per Day',
+        y='CGPA',
+        title='Study Hours per Day vs. CGPA',
+        opacity=0.6,
+        color_discrete_sequence=['darkgreen']
+    )
+    # Least-squares trend line (replaces trendline="ols", which needs statsmodels)
+    xs, ys = aggs['study_hours_trend']
+    fig_scatter.add_scatter(x=xs, y=ys, mode='lines', name='OLS trend', line={'color': 'darkgreen'})
+    fig_scatter.update_layout(xaxis_title='Study Hours per Day', yaxis_title='CGPA')
+
+    # 2. Boxplot: CGPA by Attendance Category
+    # Quartiles are pre-computed per category (already in Low -> High order)
+    fig_box = go.Figure(box_traces(aggs['cgpa_box_by_attendance'], px.colors.qualitative.D3))
+    fig_box.update_layout(title='CGPA Distribution by Attendance Category', xaxis_title='Attendance Category', yaxis_title='CGPA')
+
+    # 3. Heatmap: Correlation between Study Habits and CGPA
+    z, labels = aggs['corr_matrix']
+
+    # Annotated heatmap built from the ndarray directly (no DataFrame round-trip)
+    fig_heatmap = go.Figure(go.Heatmap(
+        z=z,
+        x=labels,
+        y=labels,
+        text=np.round(z, 2),
+        texttemplate='%{text}',
+        # FIX: Changed 'mako' (Matplotlib colormap) to 'Viridis' (standard Plotly colormap)
+        colorscale='Viridis',
+        showscale=True
+    ))
+
+    fig_heatmap.update_layout(
+        title='Correlation Matrix of Academic Discipline Factors and CGPA',
+        autosize=True,
+        xaxis={'side': 'bottom'},
+        margin={'t': 50, 'l': 50, 'r': 50, 'b': 50}
+    )
+
+    return {'scatter': fig_scatter, 'box': fig_box, 'heatmap': fig_heatmap}
+
+@st.cache_resource
+def nonacad_figures(file_path):
+    """Builds the Objective 3 figures."""
+    import plotly.express as px
+    import plotly.graph_objects as go
+
+    df = load_and_clean_data(file_path, columns=('Scholarship Status', 'CGPA'))
+    aggs = nonacad_aggs(file_path)
+
+    # 1. Average CGPA by Social Media Usage (Bar Chart)
+    # Rows come out in the ordered Categorical's bin order
+    fig_bar = px.bar(
+        aggs['avg_cgpa_by_social_media'],
+        x='Social Media Category',
+        y='CGPA',
+        title='Average CGPA by Social Media Usage',
+        color='Social Media Category',
+        color_discrete_sequence=px.colors.sequential.Viridis,
+        text_auto='.2f'
+    )
+    fig_bar.update_layout(yaxis_title='Average CGPA', xaxis_title='Social Media Usage (Hours/Day)')
+
+    # 2. Violin Plot: CGPA by Scholarship Status
+    fig_violin = px.violin(
+        df,
+        x='Scholarship Status',
+        y='CGPA',
+        box=True, 
+        points="all", 
+        title='CGPA Distribution by Scholarship Status',
+        color='Scholarship Status',
+        color_discrete_sequence=px.colors.qualitative.Vivid
+    )
+    fig_violin.update_layout(xaxis_title='Scholarship Status', yaxis_title='CGPA')
+
+    # 3. Boxplot: CGPA by Family Income Category
+    # Quartiles are pre-computed per category (already in Low -> High order)
+    fig_box = go.Figure(box_traces(aggs['cgpa_box_by_income'], px.colors.qualitative.T10))
+    fig_box.update_layout(title='CGPA Distribution by Family Income Category', xaxis_title='Family Income Category', yaxis_title='CGPA')
+
+    return {'bar': fig_bar, 'violin': fig_violin, 'box': fig_box}
+
 # --- PAGE 1: OBJECTIVE 1 - GENERAL OVERVIEW ---
 
 def page_1_overview():
     st.title("Objective 1: General Overview of Student Performance 🎓")
     st.markdown("---")
 
-    df = load_and_clean_data(DATA_FILE)
-
     # --- Section: Objective Statement ---
     st.subheader("Objective Statement")
     st.write(
@@ -98,52 +395,23 @@ def page_1_overview():
     # --- Visualizations ---
     st.subheader("Visualizations")
 
-    if 'CGPA' in df.columns and 'Gender' in df.columns:
+    if has_columns(DATA_FILE, frozenset(), ('CGPA', 'Gender')):
+        figs = overview_figures(DATA_FILE)
         col1, col2 = st.columns(2)
 
         # 1. CGPA Distribution (Histogram)
         with col1:
             st.write("**CGPA Distribution**")
-            fig_hist = px.histogram(
-                df,
-                x='CGPA',
-                nbins=20,
-                title='Distribution of Student CGPA',
-                color_discrete_sequence=['#3178C6']
-            )
-            fig_hist.update_layout(xaxis_title='CGPA', yaxis_title='Frequency')
-            st.plotly_chart(fig_hist, use_container_width=True)
+            st.plotly_chart(figs['hist'], use_container_width=True)
 
         # 2. Gender Distribution (Pie Chart)
         with col2:
             st.write("**Gender Distribution**")
-            gender_counts = df['Gender'].value_counts().reset_index()
-            gender_counts.columns = ['Gender', 'Count']
-            fig_pie = px.pie(
-                gender_counts,
-                names='Gender',
-                values='Count',
-                title='Gender Distribution',
-                color='Gender',
-                color_discrete_map={'Male': '#1f77b4', 'Female': '#2ca02c'}
-            )
-            fig_pie.update_traces(textposition='inside', textinfo='percent+label')
-            st.plotly_chart(fig_pie, use_container_width=True)
+            st.plotly_chart(figs['pie'], use_container_width=True)
 
         # 3. Average CGPA by Gender (Bar Chart)
         st.write("**Average CGPA by Gender**")
-        average_cgpa_by_gender = df.groupby('Gender')['CGPA'].mean().reset_index().sort_values(by='CGPA', ascending=False)
-        fig_bar = px.bar(
-            average_cgpa_by_gender,
-            x='Gender',
-            y='CGPA',
-            title='Average CGPA by Gender',
-            color='Gender',
-            color_discrete_map={'Male': '#1f77b4', 'Female': '#2ca02c'},
-            text_auto='.2f'
-        )
-        fig_bar.update_layout(yaxis_title='Average CGPA')
-        st.plotly_chart(fig_bar, use_container_width=True)
+        st.plotly_chart(figs['bar'], use_container_width=True)
 
     # --- Summary Box ---
     st.subheader("Summary Box")
@@ -159,7 +427,7 @@ def page_2_study_habits():
     st.title("Objective 2: Relationship Between Study Habits and Performance 📚")
     st.markdown("---")
 
-    df = load_and_clean_data(DATA_FILE)
+    required_cols = ('Study Hours per Day', 'CGPA', 'Attendance_Category', 'Attendance_numeric', 'Study Sessions per Day')
 
     # --- Section: Objective Statement ---
     st.subheader("Objective Statement")
@@ -170,72 +438,23 @@ def page_2_study_habits():
     # --- Visualizations ---
     st.subheader("Visualizations")
 
-    required_cols = ['Study Hours per Day', 'CGPA', 'Attendance_Category', 'Attendance_numeric', 'Study Sessions per Day']
-    if all(col in df.columns for col in required_cols):
-        
+    if has_columns(DATA_FILE, frozenset({'attendance'}), required_cols):
+        figs = study_figures(DATA_FILE)
         col1, col2 = st.columns(2)
 
         # 1. Scatter Plot: Study Hours per Day vs CGPA
         with col1:
             st.write("**Study Hours per Day vs. CGPA**")
-            fig_scatter = px.scatter(
-                df,
-                x='Study Hours per Day',
-                y='CGPA',
-                title='Study Hours per Day vs. CGPA',
-                opacity=0.6,
-                trendline="ols",
-                color_discrete_sequence=['darkgreen']
-            )
-            fig_scatter.update_layout(xaxis_title='Study Hours per Day', yaxis_title='CGPA')
-            st.plotly_chart(fig_scatter, use_container_width=True)
+            st.plotly_chart(figs['scatter'], use_container_width=True)
 
         # 2. Boxplot: CGPA by Attendance Category
         with col2:
             st.write("**CGPA Distribution by Attendance Category**")
-            # Explicitly set the order for the plot
-            order = ['Low (<=70%)', 'Medium (71-85%)', 'High (>85%)']
-            
-            fig_box = px.box(
-                df,
-                x='Attendance_Category',
-                y='CGPA',
-                title='CGPA Distribution by Attendance Category',
-                color='Attendance_Category',
-                category_orders={'Attendance_Category': order}, # Ensure correct order
-                color_discrete_sequence=px.colors.qualitative.D3 
-            )
-            fig_box.update_layout(xaxis_title='Attendance Category', yaxis_title='CGPA')
-            st.plotly_chart(fig_box, use_container_width=True)
+            st.plotly_chart(figs['box'], use_container_width=True)
 
         # 3. Heatmap: Correlation between Study Habits and CGPA
         st.write("**Correlation Matrix of Academic Discipline Factors and CGPA**")
-        correlation_cols = ['Study Hours per Day', 'Attendance_numeric', 'Study Sessions per Day', 'CGPA']
-        corr_matrix = df[correlation_cols].corr()
-        
-        # Use Plotly Figure Factory for a visually appealing heatmap
-        z = corr_matrix.values
-        x = corr_matrix.columns.tolist()
-        y = corr_matrix.index.tolist()
-
-        fig_heatmap = ff.create_annotated_heatmap(
-            z,
-            x=x,
-            y=y,
-            annotation_text=corr_matrix.round(2).values,
-            # FIX: Changed 'mako' (Matplotlib colormap) to 'Viridis' (standard Plotly colormap)
-            colorscale='Viridis', 
-            showscale=True
-        )
-        
-        fig_heatmap.update_layout(
-            title='Correlation Matrix of Academic Discipline Factors and CGPA',
-            autosize=True,
-            xaxis={'side': 'bottom'},
-            margin={'t': 50, 'l': 50, 'r': 50, 'b': 50}
-        )
-
-        st.plotly_chart(fig_heatmap, use_container_width=True)
+        st.plotly_chart(figs['heatmap'], use_container_width=True)
 
     # --- Summary Box ---
     st.subheader("Summary Box")
@@ -251,7 +470,7 @@ def page_3_non_academic():
     st.title("Objective 3: Impact of Non-Academic Factors on Student Performance 🌍")
     st.markdown("---")
 
-    df = load_and_clean_data(DATA_FILE)
+    required_cols = ('Social Media Category', 'CGPA', 'Scholarship Status', 'Family Income Category')
 
     # --- Section: Objective Statement ---
     st.subheader("Objective Statement")
@@ -262,63 +481,23 @@ def page_3_non_academic():
     # --- Visualizations ---
     st.subheader("Visualizations")
 
-    required_cols = ['Social Media Category', 'CGPA', 'Scholarship Status', 'Family Income Category']
-    if all(col in df.columns for col in required_cols):
-
+    if has_columns(DATA_FILE, frozenset({'social', 'income'}), required_cols):
+        figs = nonacad_figures(DATA_FILE)
         col1, col2 = st.columns(2)
 
         # 1. Average CGPA by Social Media Usage (Bar Chart)
         with col1:
             st.write("**Average CGPA by Social Media Usage Category**")
-            # Explicitly set the order for the plot
-            ordered_categories = ['0 hours', '1-2 hours', '3-5 hours', '>5 hours']
-            average_cgpa_by_social_media = df.groupby('Social Media Category', observed=False)['CGPA'].mean().reset_index()
-
-            fig_bar = px.bar(
-                average_cgpa_by_social_media,
-                x='Social Media Category',
-                y='CGPA',
-                title='Average CGPA by Social Media Usage',
-                color='Social Media Category',
-                category_orders={'Social Media Category': ordered_categories}, # Ensure correct order
-                color_discrete_sequence=px.colors.sequential.Viridis,
-                text_auto='.2f'
-            )
-            fig_bar.update_layout(yaxis_title='Average CGPA', xaxis_title='Social Media Usage (Hours/Day)')
-            st.plotly_chart(fig_bar, use_container_width=True)
+            st.plotly_chart(figs['bar'], use_container_width=True)
 
         # 2. Violin Plot: CGPA by Scholarship Status
         with col2:
             st.write("**CGPA Distribution by Scholarship Status**")
-            fig_violin = px.violin(
-                df,
-                x='Scholarship Status',
-                y='CGPA',
-                box=True, 
-                points="all", 
-                title='CGPA Distribution by Scholarship Status',
-                color='Scholarship Status',
-                color_discrete_sequence=px.colors.qualitative.Vivid
-            )
-            fig_violin.update_layout(xaxis_title='Scholarship Status', yaxis_title='CGPA')
-            st.plotly_chart(fig_violin, use_container_width=True)
+            st.plotly_chart(figs['violin'], use_container_width=True)
         
         # 3. Boxplot: CGPA by Family Income Category
         st.write("**CGPA Distribution by Family Income Category**")
-        # Explicitly set the order for the plot
-        ordered_income_categories = ['Low Income', 'Medium Income', 'High Income']
-
-        fig_box = px.box(
-            df,
-            x='Family Income Category',
-            y='CGPA',
-            title='CGPA Distribution by Family Income Category',
-            color='Family Income Category',
-            category_orders={'Family Income Category': ordered_income_categories}, # Ensure correct order
-            color_discrete_sequence=px.colors.qualitative.T10
-        )
-        fig_box.update_layout(xaxis_title='Family Income Category', yaxis_title='CGPA')
-        st.plotly_chart(fig_box, use_container_width=True)
+        st.plotly_chart(figs['box'], use_container_width=True)
 
 
     # --- Summary Box ---
@@ -1,8 +1,15 @@
+import hashlib
+import itertools
+import os
+import tempfile
+
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.express as px
-import plotly.figure_factory as ff
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from data import box_stats, box_traces
 
 # --- CONSTANTS ---
 # NOTE: Update this to match your actual cleaned file name if needed
@@ -17,8 +24,175 @@ COLOR_LIFESTYLE = '#9c27b0'     # Vibrant Purple - Bold for Non-Academic/Lifesty
 COLOR_GENDER_MALE = '#2196f3'   # Bright Blue
 COLOR_GENDER_FEMALE = '#e91e63' # Hot Pink/Magenta
 
+# --- Objective statements (one per page) ---
+
+OBJECTIVE_P1 = (
+    "To explore the overall distribution of students’ academic performance and basic demographic patterns such as gender and academic progression (CGPA across semesters)."
+)
+
+OBJECTIVE_P2 = (
+    "To quantify the relationship between core academic disciplinary factors—daily study hours and class attendance—and overall academic performance (CGPA)."
+)
+
+OBJECTIVE_P3 = (
+    "To explore the influence of key lifestyle factors—specifically social media consumption, financial aid status, and family income—on the distribution of student CGPA."
+)
+
+# --- Interpretation text (static, built once at import) ---
+
+INTERPRETATION_P1 = """
+        **1. CGPA Distribution:** This histogram shows where most of the students' grades fall. If the curve is high in the middle, it means most students are performing around the average.
+        
+        **2. Average CGPA by Gender:** This chart helps us check if male and female students perform differently on average. Small differences are normal, but a large gap might suggest a factor affecting one group more than the other.
+        
+        **3. Average CGPA Across Semesters:** This line shows the average performance of students as they move through their course. A flat line means the difficulty stays the same, while a dip might point to a specific, harder semester.
+        """
+
+INTERPRETATION_P2 = """
+        **1. Average CGPA by Daily Study Hours:** This graph usually shows that more study hours lead to better grades. We look for an "ideal" study time where the grades are highest before they level off (or stop improving).
+        
+        **2. Average CGPA by Attendance Level:** This clearly shows how important class attendance is. We expect students with **High Attendance** to have the best average grades, proving that showing up is key to success.
+        
+        **3. Correlation Heatmap:** This map uses numbers to confirm our observations. A number close to **1** shows a strong, positive link. This proves that high study hours and high attendance are scientifically related to a high CGPA.
+        """
+
+INTERPRETATION_P3 = """
+        **1. Average CGPA by Daily Social Media Usage:** This chart helps us see if too much screen time is hurting grades. If the average CGPA drops sharply for the "High" usage group, it suggests a need for better digital balance.
+        
+        **2. Average CGPA by Scholarship Status:** This shows whether students receiving merit-based aid perform better than those who do not. We generally expect scholarship recipients to have higher grades, confirming the merit system.
+        
+        **3. CGPA Distribution Across Income Groups:** The box plots let us compare the range of grades across different income groups. If the average grade is much lower for one group, it points to a need for more support or financial resources for those students.
+        """
+
 # --- UTILITY FUNCTION: DATA LOADING AND CLEANING ---
 
+# Columns used anywhere in the dashboard; the Parquet copy keeps only these
+USED_COLUMNS = [
+    'admission_year', 'current_cgpa', 'gender', 'current_semester', 'study_hours_daily',
+    'average_class_attendance', 'social_media_hours_daily', 'meritorious_scholarship',
+    'income_group', 'Do you have any health issues?', 'health_issues'
+]
+
+# Columns each page's charts need (checked once per data file, see has_columns)
+OVERVIEW_COLUMNS = frozenset({'current_cgpa', 'gender', 'current_semester'})
+STUDY_COLUMNS = frozenset({'study_hours_daily', 'current_cgpa', 'average_class_attendance', 'attendance_level'})
+LIFESTYLE_COLUMNS = frozenset({'social_media_category', 'current_cgpa', 'meritorious_scholarship', 'income_group'})
+
+# Numeric columns and the dtype kind they are downcast to. They are parsed
+# untyped and coerced afterwards with errors='coerce', so one stray cell
+# becomes NaN instead of failing the whole read (average_class_attendance
+# has free-text entries and is coerced during cleaning)
+NUMERIC_DOWNCAST = {
+    'admission_year': 'integer', 'current_cgpa': 'float',
+    'study_hours_daily': 'float', 'social_media_hours_daily': 'float'
+}
+# Low-cardinality text columns, cast to category once the whole file is in
+CATEGORY_COLUMNS = ['gender', 'meritorious_scholarship', 'income_group']
+# Every other column is parsed as str: Arrow returns undecodable text as raw
+# bytes unless the column is typed str, and the C parser's category path
+# ignores encoding_errors
+PARSE_DTYPES = {col: 'str' for col in USED_COLUMNS if col not in NUMERIC_DOWNCAST}
+CSV_CHUNK_ROWS = 100_000
+# Fingerprint of the parse schema, part of the Parquet copy's file name, so a
+# change to the columns or their dtypes never reads back an older copy
+COHORT_SCHEMA_TAG = hashlib.sha1(
+    repr((USED_COLUMNS, sorted(NUMERIC_DOWNCAST.items()), CATEGORY_COLUMNS)).encode()
+).hexdigest()[:10]
+
+def read_csv_chunks(file_path):
+    """
+    Streams the CSV in chunks, parsing only USED_COLUMNS with PARSE_DTYPES,
+    so peak memory stays near one chunk of the used columns. Undecodable bytes
+    are replaced instead of retrying the whole file with another encoding.
+    """
+    chunks = pd.read_csv(
+        file_path,
+        usecols=lambda col: col in USED_COLUMNS,
+        dtype=PARSE_DTYPES,
+        chunksize=CSV_CHUNK_ROWS,
+        encoding='utf-8',
+        encoding_errors='replace'
+    )
+    return pd.concat(chunks, ignore_index=True)
+
+def read_csv_columns(file_path):
+    """
+    Parses USED_COLUMNS with PyArrow's multithreaded CSV reader and PARSE_DTYPES,
+    then coerces and downcasts the numeric columns and casts the category columns.
+    Falls back to the chunked pandas reader when the file is not valid UTF-8.
+    """
+    header = pd.read_csv(file_path, nrows=0, encoding='utf-8', encoding_errors='replace').columns
+    usecols = [col for col in header if col in USED_COLUMNS]
+    try:
+        df = pd.read_csv(
+            file_path,
+            engine='pyarrow',
+            usecols=usecols,
+            dtype={col: PARSE_DTYPES[col] for col in usecols if col in PARSE_DTYPES}
+        )
+    except (UnicodeDecodeError, pa.ArrowInvalid):
+        df = read_csv_chunks(file_path)
+    # Non-numeric cells become NaN (float32 for the float columns; admission_year
+    # only downcasts to an int dtype when it has no gaps)
+    for col, kind in NUMERIC_DOWNCAST.items():
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors='coerce', downcast=kind)
+    df = df.astype({col: 'category' for col in CATEGORY_COLUMNS if col in df.columns})
+    return df[[col for col in USED_COLUMNS if col in df.columns]]
+
+def write_parquet_atomically(df, parquet_path):
+    """
+    Writes the Parquet copy to a temp file in the same directory and swaps it in
+    with os.replace, so a session reading the copy never sees a half-written
+    file and concurrent cold starts cannot interleave their writes.
+    """
+    fd, tmp_path = tempfile.mkstemp(suffix='.tmp', dir=os.path.dirname(os.path.abspath(parquet_path)))
+    os.close(fd)
+    try:
+        df.to_parquet(tmp_path, engine='pyarrow', compression='zstd', index=False)
+        os.replace(tmp_path, parquet_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+def read_cohort(file_path):
+    """
+    Reads the target cohort through a Parquet copy of the CSV, written next to it
+    on first use (and again whenever the CSV is newer or the parse schema changes).
+    Later reads skip the CSV parse and the admission_year filter is pushed into
+    the Parquet reader, so only the cohort's rows are materialized.
+    """
+    parquet_path = f"{os.path.splitext(file_path)[0]}.{COHORT_SCHEMA_TAG}.parquet"
+    if not (os.path.exists(parquet_path) and os.path.getmtime(parquet_path) >= os.path.getmtime(file_path)):
+        df = read_csv_columns(file_path)
+        try:
+            write_parquet_atomically(df, parquet_path)
+        except OSError:
+            # Read-only checkout: use the CSV frame directly, cut to the cohort (copied,
+            # so the caller's column assignments are not made on a slice under pandas 2)
+            if 'admission_year' in df.columns:
+                df = df[df['admission_year'] == TARGET_ADMISSION_YEAR].copy()
+            return df
+
+    filters = None
+    if 'admission_year' in pq.read_schema(parquet_path).names:
+        filters = [('admission_year', '==', TARGET_ADMISSION_YEAR)]
+    return pd.read_parquet(parquet_path, engine='pyarrow', filters=filters)
+
+def bin_ordered(values, bins, labels):
+    """
+    Bins values into an ordered Categorical of `labels` + 'Unknown' (left-closed
+    bins, like pd.cut(right=False)); values outside the bins are 'Unknown'.
+    The order travels with the dtype, so groupby output and charts follow it.
+    """
+    # One searchsorted pass over the float buffer gives each value's bin code directly
+    vals = values.to_numpy(dtype='float64')
+    codes = np.searchsorted(np.asarray(bins, dtype='float64'), vals, side='right') - 1
+    # NaN sorts past the last edge, so it lands in 'Unknown' with the out-of-range values
+    codes[(codes < 0) | (codes >= len(labels))] = len(labels)
+    binned = pd.Categorical.from_codes(codes.astype('int8'), categories=list(labels) + ['Unknown'], ordered=True)
+    return pd.Series(binned, index=values.index, name=values.name)
+
 @st.cache_data
 def load_and_clean_data(file_path):
     """
@@ -26,76 +200,344 @@ def load_and_clean_data(file_path):
     columns based on the user's provided code snippets (e.g., current_cgpa, gender).
     """
     try:
-        df = pd.read_csv(file_path, encoding='utf-8')
-    except Exception:
-        try:
-            df = pd.read_csv(file_path, encoding='latin1')
-        except Exception as e:
-            st.error(f"Error loading data from {file_path}. Please ensure the file exists and is accessible. Details: {e}")
-            return pd.DataFrame()
+        df = read_cohort(file_path)
+    except Exception as e:
+        st.error(f"Error loading data from {file_path}. Please ensure the file exists and is accessible. Details: {e}")
+        return pd.DataFrame()
 
     if df.empty:
         return df
 
     # --- Data Filtering and Pre-processing ---
+    # read_cohort already returns only the target cohort's rows (Parquet row-group
+    # filter) in a frame nothing else holds, so the mask is normally a no-op check
+    # and the columns below are assigned into that frame without a second copy.
+    # A real cut is copied, so pandas 2 does not flag the assignments on a slice
     if 'admission_year' in df.columns:
-        df_filtered = df[df['admission_year'] == TARGET_ADMISSION_YEAR].copy()
+        in_cohort = df['admission_year'] == TARGET_ADMISSION_YEAR
+        df_filtered = df if in_cohort.all() else df[in_cohort].copy()
     else:
         st.warning("Column 'admission_year' not found. Using entire dataset.")
-        df_filtered = df.copy()
+        df_filtered = df
 
     # Ensure necessary columns are numeric and handle missing values for metrics/plots
     required_numeric_cols = [
         'current_cgpa', 'study_hours_daily', 'average_class_attendance', 
         'social_media_hours_daily'
     ]
-    for col in required_numeric_cols:
+    numeric_cols = [col for col in required_numeric_cols if col in df_filtered.columns]
+    # Coerce all columns in one shot; float32 halves the bytes every later groupby/corr has to stream
+    df_filtered[numeric_cols] = df_filtered[numeric_cols].apply(pd.to_numeric, errors='coerce', downcast='float')
+    # Fill NaNs with the mean for numerical columns (one fillna pass with precomputed means)
+    df_filtered[numeric_cols] = df_filtered[numeric_cols].fillna(df_filtered[numeric_cols].mean())
+
+    # Integer columns to the smallest int dtype that fits (int16 year, int8 semester);
+    # a stray value such as "8th" becomes NaN (and the column stays float) instead of raising
+    for col in ['admission_year', 'current_semester']:
+        if col in df_filtered.columns:
+            df_filtered[col] = pd.to_numeric(df_filtered[col], errors='coerce', downcast='integer')
+
+    # Older exports use the raw survey question for the health column
+    if 'health_issues' not in df_filtered.columns and 'Do you have any health issues?' in df_filtered.columns:
+        df_filtered = df_filtered.rename(columns={'Do you have any health issues?': 'health_issues'})
+
+    # Low-cardinality text columns as categories (int8 codes for groupby/compare)
+    for col in ['gender', 'meritorious_scholarship', 'income_group', 'health_issues']:
         if col in df_filtered.columns:
-            df_filtered[col] = pd.to_numeric(df_filtered[col], errors='coerce')
-            # Fill NaNs with the mean for numerical columns
-            df_filtered[col].fillna(df_filtered[col].mean(), inplace=True)
+            df_filtered[col] = df_filtered[col].astype('category')
 
     # --- Categorical Binning (for objectives) ---
     
     # 1. Attendance Level (Objective 2)
     if 'average_class_attendance' in df_filtered.columns:
-        df_filtered['attendance_level'] = pd.cut(
+        df_filtered['attendance_level'] = bin_ordered(
             df_filtered['average_class_attendance'],
             bins=[0, 60, 80, 100],
-            labels=['Low Attendance', 'Medium Attendance', 'High Attendance'],
-            right=False,
-            include_lowest=True
-        ).astype(str).replace('nan', 'Unknown')
+            labels=['Low Attendance', 'Medium Attendance', 'High Attendance']
+        )
         
     # 2. Social Media Hours Category (Objective 3)
     if 'social_media_hours_daily' in df_filtered.columns:
         bins = [-1, 1, 3, 6, df_filtered['social_media_hours_daily'].max() + 1] 
         labels = ['Very Low (<1h)', 'Low (1-3h)', 'Medium (3-6h)', 'High (>6h)']
-        df_filtered['social_media_category'] = pd.cut(
-            df_filtered['social_media_hours_daily'], 
-            bins=bins, 
-            labels=labels, 
-            right=False, 
-            include_lowest=True
-        ).astype(str).replace('nan', 'Unknown')
+        df_filtered['social_media_category'] = bin_ordered(df_filtered['social_media_hours_daily'], bins, labels)
 
     return df_filtered
 
 
-# --- PAGE 1: OBJECTIVE 1 - GENERAL OVERVIEW ---
+# --- CACHED PAGE AGGREGATIONS ---
+# Keyed by the data file (the cohort frame is a pure function of it), so
+# switching pages turns these groupby/corr passes into cache lookups.
+
+@st.cache_data
+def group_mean(file_path, by, target='current_cgpa'):
+    """Average `target` per observed group of `by`, as a two-column frame."""
+    df = load_and_clean_data(file_path)
+    # Project to the two columns first; keep the sort, the charts draw in group order
+    return df[[by, target]].groupby(by, observed=True)[target].mean().reset_index()
+
+@st.cache_data
+def has_columns(file_path, required):
+    """Schema check for a page, cached so the pages don't re-validate on every rerun."""
+    return required.issubset(load_and_clean_data(file_path).columns)
+
+@st.cache_data
+def column_means(file_path, cols):
+    """Means of several columns in one pass, as a Series indexed by column."""
+    df = load_and_clean_data(file_path)
+    return df[list(cols)].mean()
+
+@st.cache_data
+def most_frequent(file_path, col):
+    """Most common value of a column ("N/A" if empty); value_counts avoids mode()'s sort of the values."""
+    values = load_and_clean_data(file_path)[col]
+    return values.value_counts().idxmax() if len(values) else "N/A"
+
+def group_value(table, by, key, target='current_cgpa'):
+    """Looks up one group's value in a group_mean table (NaN if the group is absent)."""
+    values = table.loc[table[by] == key, target]
+    return values.iat[0] if len(values) else np.nan
+
+@st.cache_data
+def group_box_stats(file_path, by, target='current_cgpa'):
+    """
+    box_stats table (see data.py) of `target` per group of `by`, in order of
+    first appearance (the order px.box uses).
+    """
+    df = load_and_clean_data(file_path)
+    return box_stats(df[[by, target]], by, target, sort=False)
+
+def bar_traces(table, by, colors, target='current_cgpa'):
+    """
+    One go.Bar per group (like px.bar with color=...), built straight from the
+    group_mean table's arrays and labelled with the 2-decimal value. The figure
+    needs barmode='relative' (px.bar's default) so each bar fills its slot and
+    sits on its tick instead of being grouped.
+    """
+    import plotly.graph_objects as go
+    groups = table[by].to_numpy()
+    values = table[target].to_numpy()
+    return [
+        go.Bar(name=str(group), x=[str(group)], y=[value], marker_color=color,
+               texttemplate='%{y:.2f}', textposition='auto')
+        for group, value, color in zip(groups, values, itertools.cycle(colors))
+    ]
+
+@st.cache_data
+def corr_matrix(file_path, cols):
+    """Correlation matrix of the given columns (one np.corrcoef over the float32 block)."""
+    df = load_and_clean_data(file_path)
+    arr = df[list(cols)].to_numpy(dtype=np.float32)
+    return pd.DataFrame(np.corrcoef(arr, rowvar=False), index=list(cols), columns=list(cols))
+
+# Per-page metric values, reduced once per data file. cache_resource hands
+# back the same dict, so metric reruns skip cache_data's per-call unpickling.
+
+@st.cache_resource
+def overview_aggs(file_path):
+    """Objective 1 metric values."""
+    overall = column_means(file_path, ('current_cgpa', 'current_semester'))
+    avg_cgpa_by_gender = group_mean(file_path, 'gender')
+    return {
+        'avg_cgpa': overall['current_cgpa'],
+        'avg_semester': overall['current_semester'],
+        'male_avg_cgpa': group_value(avg_cgpa_by_gender, 'gender', 'Male'),
+        'female_avg_cgpa': group_value(avg_cgpa_by_gender, 'gender', 'Female'),
+    }
+
+@st.cache_resource
+def study_aggs(file_path):
+    """Objective 2 metric values."""
+    overall = column_means(file_path, ('study_hours_daily', 'average_class_attendance'))
+    corr = corr_matrix(file_path, ('study_hours_daily', 'average_class_attendance', 'current_cgpa'))
+    return {
+        'avg_study_hours': overall['study_hours_daily'],
+        'avg_attendance': overall['average_class_attendance'],
+        'high_attendance_cgpa': group_value(group_mean(file_path, 'attendance_level'), 'attendance_level', 'High Attendance'),
+        # Correlation between study_hours_daily and current_cgpa (read off the heatmap's matrix)
+        'study_cgpa_corr': corr.loc['study_hours_daily', 'current_cgpa'],
+    }
+
+@st.cache_resource
+def lifestyle_aggs(file_path):
+    """Objective 3 metric values."""
+    df = load_and_clean_data(file_path)
+    # Percentage with health issues (string ops on a category only touch its few categories)
+    health_issues_percent = 0
+    if 'health_issues' in df.columns:
+        health_issues_percent = df['health_issues'].str.lower().eq('yes').mean() * 100
+    return {
+        'scholarship_cgpa': group_value(group_mean(file_path, 'meritorious_scholarship'), 'meritorious_scholarship', 'Yes'),
+        'high_social_media_cgpa': group_value(group_mean(file_path, 'social_media_category'), 'social_media_category', 'High (>6h)'),
+        'most_freq_income': most_frequent(file_path, 'income_group'),
+        'health_issues_percent': health_issues_percent,
+    }
 
-def page_1_overview(df):
-    st.title("Objective 1: General Overview of Student Performance 🎓")
+
+# --- CACHED FIGURES ---
+# Built once from the cached aggregates; cache_resource returns the same
+# Figure object on every rerun instead of re-running plotly.express.
+# Plotly is imported inside the builders, so a cold start paints the page
+# shell and metric cards before paying for the Plotly import.
+
+@st.cache_resource
+def overview_figures(file_path):
+    """Builds the Objective 1 figures."""
+    import plotly.graph_objects as go
+
+    df = load_and_clean_data(file_path)
+
+    # 1. CGPA Distribution (Histogram)
+    # Binned here so only the 20 bar heights reach the browser
+    counts, edges = np.histogram(df['current_cgpa'].dropna().to_numpy(), bins=20)
+    fig_hist = go.Figure(go.Bar(
+        x=(edges[:-1] + edges[1:]) / 2, y=counts, width=np.diff(edges),
+        marker_color=COLOR_PRIMARY_CGPA # BOLD COLOR 1
+    ), layout=go.Layout(
+        title='CGPA Distribution of Students', xaxis_title='CGPA', yaxis_title='Frequency', bargap=0
+    ))
+
+    # 2. Average CGPA by Gender (Bar Chart) - Already uses multiple colors
+    avg_cgpa_by_gender = group_mean(file_path, 'gender')
+    # Uses distinct bold colors for Male/Female
+    gender_colors = {'Male': COLOR_GENDER_MALE, 'Female': COLOR_GENDER_FEMALE}
+    fig_bar_gender = go.Figure(bar_traces(
+        avg_cgpa_by_gender, 'gender', [gender_colors.get(g) for g in avg_cgpa_by_gender['gender']]
+    ), layout=go.Layout(
+        title='Average CGPA by Gender', yaxis_title='Average CGPA', xaxis_title='Gender', legend_title_text='gender', barmode='relative'
+    ))
+
+    # 3. Average CGPA Across Semesters (Line Plot)
+    avg_sem = group_mean(file_path, 'current_semester')
+    # WebGL trace: drawn on one canvas instead of an SVG node per point
+    fig_line = go.Figure(go.Scattergl(
+        x=avg_sem['current_semester'], y=avg_sem['current_cgpa'], mode='lines+markers',
+        line={'color': COLOR_PRIMARY_CGPA} # BOLD COLOR 1
+    ), layout=go.Layout(
+        title="Average CGPA Across Semesters", xaxis_title='Semester', yaxis_title='Average CGPA'
+    ))
+
+    return {'hist': fig_hist, 'gender': fig_bar_gender, 'semester': fig_line}
+
+@st.cache_resource
+def study_figures(file_path):
+    """Builds the Objective 2 figures."""
+    import plotly.express as px
+    import plotly.graph_objects as go
+
+    # 1. Average CGPA by Study Hours (Bar Chart) - Now multi-colored
+    avg_cgpa_by_study_hours = group_mean(file_path, 'study_hours_daily')
+    # Numeric hours, so the bars are shaded along a continuous color axis (as px.bar did)
+    hours = avg_cgpa_by_study_hours['study_hours_daily'].to_numpy()
+    fig_bar_study = go.Figure(go.Bar(
+        x=hours, y=avg_cgpa_by_study_hours['current_cgpa'].to_numpy(),
+        marker={'color': hours, 'coloraxis': 'coloraxis'},
+        texttemplate='%{y:.2f}', textposition='auto'
+    ), layout=go.Layout(
+        title='Average CGPA by Daily Study Hours', xaxis_title='Daily Study Hours', yaxis_title='Average CGPA',
+        coloraxis_colorbar_title_text='study_hours_daily'
+    ))
+
+    # 2. Average CGPA by Attendance Level (Bar Chart) - Now multi-colored
+    # Rows come out in the ordered Categorical's Low -> High order, so no category_orders needed
+    cgpa_by_attendance = group_mean(file_path, 'attendance_level')
+    fig_bar_attendance = go.Figure(bar_traces(
+        cgpa_by_attendance, 'attendance_level',
+        px.colors.qualitative.Vivid # Use a bold, multi-color sequence
+    ), layout=go.Layout(
+        title="Average CGPA by Attendance Level", xaxis_title='Attendance Category', yaxis_title='Average CGPA', legend_title_text='attendance_level', barmode='relative'
+    ))
+
+    # 3. Correlation Heatmap
+    corr = corr_matrix(file_path, ('study_hours_daily', 'average_class_attendance', 'current_cgpa'))
+    labels = list(corr.columns)
+    fig_heatmap = go.Figure(go.Heatmap(
+        z=corr.to_numpy(), x=labels, y=labels, coloraxis='coloraxis',
+        texttemplate='%{z:.2f}'
+    ), layout=go.Layout(
+        title="Correlation Matrix of Academic Discipline Factors and CGPA",
+        # Use a bold, modern gradient for the heatmap
+        coloraxis={'colorscale': 'Plasma'},
+        # First row at the top, like px.imshow
+        xaxis={'side': 'bottom'}, yaxis={'autorange': 'reversed'}
+    ))
+
+    return {'study_hours': fig_bar_study, 'attendance': fig_bar_attendance, 'heatmap': fig_heatmap}
+
+@st.cache_resource
+def lifestyle_figures(file_path):
+    """Builds the Objective 3 figures."""
+    import plotly.express as px
+    import plotly.graph_objects as go
+
+    # 1. Average CGPA by Social Media Usage (Bar Chart) - Now multi-colored
+    # Rows come out in the ordered Categorical's order, so no category_orders needed
+    avg_social = group_mean(file_path, 'social_media_category')
+    fig_bar_social = go.Figure(bar_traces(
+        avg_social, 'social_media_category',
+        px.colors.qualitative.Vivid # Use a bold, multi-color sequence
+    ), layout=go.Layout(
+        title="Average CGPA by Daily Social Media Usage", xaxis_title='Hours on Social Media per Day', yaxis_title='Average CGPA', legend_title_text='social_media_category', barmode='relative'
+    ))
+
+    # 2. Average CGPA by Scholarship Status (Bar Chart) - Now multi-colored
+    avg_sch = group_mean(file_path, 'meritorious_scholarship')
+    fig_bar_sch = go.Figure(bar_traces(
+        avg_sch, 'meritorious_scholarship',
+        px.colors.qualitative.Vivid # Use a bold, multi-color sequence
+    ), layout=go.Layout(
+        title="Average CGPA by Scholarship Status", xaxis_title='Scholarship Status', yaxis_title='Average CGPA', legend_title_text='meritorious_scholarship', barmode='relative'
+    ))
+
+    # 3. CGPA Distribution Across Income Groups (Box Plot) - Already multi-colored
+    # Quartiles are computed server-side, so only 5 numbers and the outliers per group reach the browser
+    fig_box_income = go.Figure(box_traces(
+        group_box_stats(file_path, 'income_group'),
+        # This plot already uses a bold, multi-color sequence
+        px.colors.qualitative.Vivid
+    ), layout=go.Layout(
+        title="CGPA Distribution Across Income Groups", xaxis_title='Income Group', yaxis_title='CGPA'
+    ))
+
+    return {'social': fig_bar_social, 'scholarship': fig_bar_sch, 'income': fig_box_income}
+
+
+# --- PAGE LAYOUT (shared by the three objective pages) ---
+
+def render_page(title, metrics, objective, charts, interpretation):
+    """
+    Lays out one objective page: title, summary cards, objective statement,
+    charts and interpretation. The text comes from the module-level constants.
+    """
+    st.title(title)
     st.markdown("---")
-    
+
     # 1. Summary Box (Metric Cards) - MOVED UP
     st.subheader("Summary Box")
-    
-    # Calculate metrics for Objective 1
-    avg_cgpa = df['current_cgpa'].mean()
-    avg_semester = df['current_semester'].mean()
-    male_avg_cgpa = df[df['gender'] == 'Male']['current_cgpa'].mean()
-    female_avg_cgpa = df[df['gender'] == 'Female']['current_cgpa'].mean()
+    metrics()
+
+    # 2. Objective Statement
+    st.subheader("Objective Statement")
+    st.write(objective)
+
+    # 3. Visualizations
+    st.subheader("Visualizations")
+    charts()
+
+    # 4. Interpretation/Discussion (Simplified English - Broken down by chart)
+    st.subheader("Interpretation/Discussion")
+    st.markdown(interpretation)
+
+
+# --- PAGE 1: OBJECTIVE 1 - GENERAL OVERVIEW ---
+
+@st.fragment
+def overview_metrics():
+    """Objective 1 metric cards; as a fragment it reruns without the charts."""
+    # Calculate metrics for Objective 1 (from the cached tables the charts also use)
+    aggs = overview_aggs(DATA_FILE)
+    avg_cgpa, avg_semester = aggs['avg_cgpa'], aggs['avg_semester']
+    male_avg_cgpa, female_avg_cgpa = aggs['male_avg_cgpa'], aggs['female_avg_cgpa']
 
     col1, col2, col3, col4 = st.columns(4)
     
@@ -108,91 +550,54 @@ def page_1_overview(df):
                 help="Average CGPA specifically for Male students.", border=True)
     col4.metric(label="Female Avg CGPA", value=f"{female_avg_cgpa:.2f}", 
                 help="Average CGPA specifically for Female students.", border=True)
-    
-    # 2. Objective Statement
-    st.subheader("Objective Statement")
-    st.write(
-        "To explore the overall distribution of students’ academic performance and basic demographic patterns such as gender and academic progression (CGPA across semesters)."
-    )
 
-    # 3. Visualizations
-    st.subheader("Visualizations")
-    if all(col in df.columns for col in ['current_cgpa', 'gender', 'current_semester']):
+@st.fragment
+def overview_charts():
+    """Objective 1 charts; as a fragment it reruns without the metric cards."""
+    if has_columns(DATA_FILE, OVERVIEW_COLUMNS):
         
+        figs = overview_figures(DATA_FILE)
+
         # Charts 1 and 2 (Half-width)
         col1, col2 = st.columns(2)
 
         # 1. CGPA Distribution (Histogram)
         with col1:
             st.write("**CGPA Distribution**")
-            # Keeping this chart as requested (single color)
-            fig_hist = px.histogram(
-                df, x='current_cgpa', nbins=20, title='CGPA Distribution of Students', 
-                color_discrete_sequence=[COLOR_PRIMARY_CGPA] # BOLD COLOR 1
-            )
-            fig_hist.update_layout(xaxis_title='CGPA', yaxis_title='Frequency')
-            st.plotly_chart(fig_hist, use_container_width=True)
+            st.plotly_chart(figs['hist'], use_container_width=True)
 
         # 2. Average CGPA by Gender (Bar Chart) - Already uses multiple colors
         with col2:
             st.write("**Average CGPA by Gender**")
-            avg_cgpa_by_gender = df.groupby('gender', observed=True)['current_cgpa'].mean().reset_index()
-            fig_bar_gender = px.bar(
-                avg_cgpa_by_gender, x='gender', y='current_cgpa', title='Average CGPA by Gender',
-                color='gender', 
-                # Uses distinct bold colors for Male/Female
-                color_discrete_map={'Male': COLOR_GENDER_MALE, 'Female': COLOR_GENDER_FEMALE}, 
-                text_auto='.2f'
-            )
-            fig_bar_gender.update_layout(yaxis_title='Average CGPA', xaxis_title='Gender')
-            st.plotly_chart(fig_bar_gender, use_container_width=True)
+            st.plotly_chart(figs['gender'], use_container_width=True)
 
         # 3. Average CGPA Across Semesters (Line Plot)
         # Wrapping in columns to enforce half-width size consistency
         col3, _ = st.columns(2)
         with col3:
             st.write("**Average CGPA Across Semesters**")
-            avg_sem = df.groupby("current_semester", observed=True)["current_cgpa"].mean().reset_index()
-            fig_line = px.line(
-                avg_sem, x="current_semester", y="current_cgpa", 
-                title="Average CGPA Across Semesters", markers=True, 
-                color_discrete_sequence=[COLOR_PRIMARY_CGPA] # BOLD COLOR 1
-            )
-            fig_line.update_layout(xaxis_title='Semester', yaxis_title='Average CGPA')
-                
-            st.plotly_chart(fig_line, use_container_width=True)
+            st.plotly_chart(figs['semester'], use_container_width=True)
 
-    # 4. Interpretation/Discussion (Simplified English - Broken down by chart)
-    st.subheader("Interpretation/Discussion")
-    st.markdown(
-        """
-        **1. CGPA Distribution:** This histogram shows where most of the students' grades fall. If the curve is high in the middle, it means most students are performing around the average.
-        
-        **2. Average CGPA by Gender:** This chart helps us check if male and female students perform differently on average. Small differences are normal, but a large gap might suggest a factor affecting one group more than the other.
-        
-        **3. Average CGPA Across Semesters:** This line shows the average performance of students as they move through their course. A flat line means the difficulty stays the same, while a dip might point to a specific, harder semester.
-        """
+
+def page_1_overview():
+    render_page(
+        "Objective 1: General Overview of Student Performance 🎓",
+        overview_metrics, OBJECTIVE_P1, overview_charts, INTERPRETATION_P1
     )
 
 
 # --- PAGE 2: OBJECTIVE 2 - ACADEMIC DISCIPLINE AND PERFORMANCE ---
 
-def page_2_study_habits(df):
-    st.title("Objective 2: Relationship Between Academic Discipline and Performance 📚")
-    st.markdown("---")
-
-    # 1. Summary Box (Metric Cards) - MOVED UP
-    st.subheader("Summary Box")
-
-    # Calculate metrics for Objective 2
-    avg_study_hours = df['study_hours_daily'].mean()
-    avg_attendance = df['average_class_attendance'].mean()
-    # Calculate CGPA for High Attendance, handling potential missing group
-    high_attendance_cgpa = df[df['attendance_level'] == 'High Attendance']['current_cgpa'].mean()
+@st.fragment
+def study_metrics():
+    """Objective 2 metric cards; as a fragment it reruns without the charts."""
+    # Calculate metrics for Objective 2 (from the cached tables the charts also use)
+    aggs = study_aggs(DATA_FILE)
+    avg_study_hours, avg_attendance = aggs['avg_study_hours'], aggs['avg_attendance']
+    # CGPA for High Attendance, handling potential missing group
+    high_attendance_cgpa = aggs['high_attendance_cgpa']
     if pd.isna(high_attendance_cgpa): high_attendance_cgpa = 0.0
-    
-    # Correlation between study_hours_daily and current_cgpa
-    study_cgpa_corr = df[['study_hours_daily', 'current_cgpa']].corr().iloc[0, 1]
+    study_cgpa_corr = aggs['study_cgpa_corr']
 
     col1, col2, col3, col4 = st.columns(4)
 
@@ -205,106 +610,54 @@ def page_2_study_habits(df):
     col4.metric(label="Study/CGPA Correlation", value=f"{study_cgpa_corr:.2f}", 
                 help="Correlation coefficient between daily study hours and CGPA.", border=True)
 
-    # 2. Objective Statement
-    st.subheader("Objective Statement")
-    st.write(
-        "To quantify the relationship between core academic disciplinary factors—daily study hours and class attendance—and overall academic performance (CGPA)."
-    )
-
-    # 3. Visualizations
-    st.subheader("Visualizations")
-    required_cols = ['study_hours_daily', 'current_cgpa', 'average_class_attendance', 'attendance_level']
-    if all(col in df.columns for col in required_cols):
+@st.fragment
+def study_charts():
+    """Objective 2 charts; as a fragment it reruns without the metric cards."""
+    if has_columns(DATA_FILE, STUDY_COLUMNS):
         
+        figs = study_figures(DATA_FILE)
+
         # Charts 1 and 2 (Half-width)
         col1, col2 = st.columns(2)
 
         # 1. Average CGPA by Study Hours (Bar Chart) - Now multi-colored
         with col1:
             st.write("**Average CGPA by Daily Study Hours**")
-            avg_cgpa_by_study_hours = df.groupby('study_hours_daily', observed=True)['current_cgpa'].mean().reset_index()
-            fig_bar_study = px.bar(
-                avg_cgpa_by_study_hours, x='study_hours_daily', y='current_cgpa', 
-                title='Average CGPA by Daily Study Hours', 
-                color='study_hours_daily', # Color based on the category for distinct colors
-                color_discrete_sequence=px.colors.qualitative.Vivid, # Use a bold, multi-color sequence
-                text_auto='.2f'
-            )
-            fig_bar_study.update_layout(xaxis_title='Daily Study Hours', yaxis_title='Average CGPA')
-            st.plotly_chart(fig_bar_study, use_container_width=True)
+            st.plotly_chart(figs['study_hours'], use_container_width=True)
 
         # 2. Average CGPA by Attendance Level (Bar Chart) - Now multi-colored
         with col2:
             st.write("**Average CGPA by Attendance Level**")
-            # Ensure correct category order
-            order = ['Low Attendance', 'Medium Attendance', 'High Attendance']
-            cgpa_by_attendance = df.groupby('attendance_level', observed=True)['current_cgpa'].mean().reset_index()
-            fig_bar_attendance = px.bar(
-                cgpa_by_attendance, x='attendance_level', y='current_cgpa', 
-                title="Average CGPA by Attendance Level", 
-                category_orders={'attendance_level': order},
-                color='attendance_level', # Color based on the category for distinct colors
-                color_discrete_sequence=px.colors.qualitative.Vivid, # Use a bold, multi-color sequence
-                text_auto='.2f'
-            )
-            fig_bar_attendance.update_layout(xaxis_title='Attendance Category', yaxis_title='Average CGPA')
-            st.plotly_chart(fig_bar_attendance, use_container_width=True)
+            st.plotly_chart(figs['attendance'], use_container_width=True)
 
         # 3. Correlation Heatmap
         # Wrapping in columns to enforce half-width size consistency
         col3, _ = st.columns(2)
         with col3:
             st.write("**Correlation between Study Hours, Attendance, and CGPA**")
-            corr_data = df[['study_hours_daily', 'average_class_attendance', 'current_cgpa']]
-            corr_matrix = corr_data.corr()
-
-            fig_heatmap = px.imshow(
-                corr_matrix, 
-                text_auto=True, 
-                aspect="auto",
-                # Use a bold, modern gradient for the heatmap
-                color_continuous_scale='Plasma', 
-                title="Correlation Matrix of Academic Discipline Factors and CGPA"
-            )
-            fig_heatmap.update_layout(xaxis={'side': 'bottom'})
-            st.plotly_chart(fig_heatmap, use_container_width=True)
-    
-    # 4. Interpretation/Discussion (Simplified English - Broken down by chart)
-    st.subheader("Interpretation/Discussion")
-    st.markdown(
-        """
-        **1. Average CGPA by Daily Study Hours:** This graph usually shows that more study hours lead to better grades. We look for an "ideal" study time where the grades are highest before they level off (or stop improving).
-        
-        **2. Average CGPA by Attendance Level:** This clearly shows how important class attendance is. We expect students with **High Attendance** to have the best average grades, proving that showing up is key to success.
-        
-        **3. Correlation Heatmap:** This map uses numbers to confirm our observations. A number close to **1** shows a strong, positive link. This proves that high study hours and high attendance are scientifically related to a high CGPA.
-        """
-    )
+            st.plotly_chart(figs['heatmap'], use_container_width=True)
 
 
-# --- PAGE 3: OBJECTIVE 3 - LIFESTYLE AND DAILY HABITS ---
+def page_2_study_habits():
+    render_page(
+        "Objective 2: Relationship Between Academic Discipline and Performance 📚",
+        study_metrics, OBJECTIVE_P2, study_charts, INTERPRETATION_P2
+    )
 
-def page_3_non_academic(df):
-    st.title("Objective 3: Impact of Lifestyle and Daily Habits on Academic Performance 🌍")
-    st.markdown("---")
 
-    # 1. Summary Box (Metric Cards) - MOVED UP
-    st.subheader("Summary Box")
+# --- PAGE 3: OBJECTIVE 3 - LIFESTYLE AND DAILY HABITS ---
 
-    # Calculate metrics for Objective 3
-    scholarship_cgpa = df[df['meritorious_scholarship'] == 'Yes']['current_cgpa'].mean()
-    
-    # Calculate CGPA for High Social Media Use, handling potential missing group
-    high_social_media_cgpa = df[df['social_media_category'] == 'High (>6h)']['current_cgpa'].mean()
+@st.fragment
+def lifestyle_metrics():
+    """Objective 3 metric cards; as a fragment it reruns without the charts."""
+    # Calculate metrics for Objective 3 (from the cached tables the charts also use)
+    aggs = lifestyle_aggs(DATA_FILE)
+    scholarship_cgpa = aggs['scholarship_cgpa']
+    # CGPA for High Social Media Use, handling potential missing group
+    high_social_media_cgpa = aggs['high_social_media_cgpa']
     if pd.isna(high_social_media_cgpa): high_social_media_cgpa = 0.0
-
-    # Calculate mode for Income Group
-    most_freq_income = df['income_group'].mode()[0] if not df['income_group'].empty else "N/A"
-    
-    # Calculate percentage with health issues (using the column name from data)
-    health_issues_percent = 0
-    if 'Do you have any health issues?' in df.columns:
-        health_issues_percent = (df['Do you have any health issues?'].str.contains('Yes', case=False, na=False).sum() / len(df)) * 100
+    most_freq_income = aggs['most_freq_income']
+    health_issues_percent = aggs['health_issues_percent']
         
     col1, col2, col3, col4 = st.columns(4)
 
@@ -317,16 +670,12 @@ def page_3_non_academic(df):
     col4.metric(label="% With Health Issues", value=f"{health_issues_percent:.1f}%", 
                 help="Percentage of students reporting a health issue.", border=True)
 
-    # 2. Objective Statement
-    st.subheader("Objective Statement")
-    st.write(
-        "To explore the influence of key lifestyle factors—specifically social media consumption, financial aid status, and family income—on the distribution of student CGPA."
-    )
+@st.fragment
+def lifestyle_charts():
+    """Objective 3 charts; as a fragment it reruns without the metric cards."""
+    if has_columns(DATA_FILE, LIFESTYLE_COLUMNS):
 
-    # 3. Visualizations
-    st.subheader("Visualizations")
-    required_cols = ['social_media_category', 'current_cgpa', 'meritorious_scholarship', 'income_group']
-    if all(col in df.columns for col in required_cols):
+        figs = lifestyle_figures(DATA_FILE)
 
         # Charts 1 and 2 (Half-width)
         col1, col2 = st.columns(2)
@@ -334,77 +683,48 @@ def page_3_non_academic(df):
         # 1. Average CGPA by Social Media Usage (Bar Chart) - Now multi-colored
         with col1:
             st.write("**Average CGPA by Daily Social Media Usage**")
-            ordered_categories = ['Very Low (<1h)', 'Low (1-3h)', 'Medium (3-6h)', 'High (>6h)', 'Unknown']
-            avg_social = df.groupby("social_media_category", observed=True)["current_cgpa"].mean().reset_index()
-            fig_bar_social = px.bar(
-                avg_social, x="social_media_category", y="current_cgpa", 
-                title="Average CGPA by Daily Social Media Usage", 
-                category_orders={'social_media_category': ordered_categories},
-                color="social_media_category", # Color based on the category for distinct colors
-                color_discrete_sequence=px.colors.qualitative.Vivid, # Use a bold, multi-color sequence
-                text_auto='.2f'
-            )
-            fig_bar_social.update_layout(xaxis_title='Hours on Social Media per Day', yaxis_title='Average CGPA')
-            st.plotly_chart(fig_bar_social, use_container_width=True)
+            st.plotly_chart(figs['social'], use_container_width=True)
 
         # 2. Average CGPA by Scholarship Status (Bar Chart) - Now multi-colored
         with col2:
             st.write("**Average CGPA by Scholarship Status**")
-            avg_sch = df.groupby("meritorious_scholarship", observed=True)["current_cgpa"].mean().reset_index()
-            fig_bar_sch = px.bar(
-                avg_sch, x="meritorious_scholarship", y="current_cgpa", 
-                title="Average CGPA by Scholarship Status", 
-                color="meritorious_scholarship", # Color based on the category for distinct colors
-                color_discrete_sequence=px.colors.qualitative.Vivid, # Use a bold, multi-color sequence
-                text_auto='.2f'
-            )
-            fig_bar_sch.update_layout(xaxis_title='Scholarship Status', yaxis_title='Average CGPA')
-            st.plotly_chart(fig_bar_sch, use_container_width=True)
+            st.plotly_chart(figs['scholarship'], use_container_width=True)
 
         # 3. CGPA Distribution Across Income Groups (Box Plot) - Already multi-colored
         # Wrapping in columns to enforce half-width size consistency
         col3, _ = st.columns(2)
         with col3:
             st.write("**CGPA Distribution Across Income Groups**")
-            fig_box_income = px.box(
-                df, x="income_group", y="current_cgpa", 
-                title="CGPA Distribution Across Income Groups", color="income_group",
-                # This plot already uses a bold, multi-color sequence
-                color_discrete_sequence=px.colors.qualitative.Vivid 
-            )
-            fig_box_income.update_layout(xaxis_title='Income Group', yaxis_title='CGPA')
-            st.plotly_chart(fig_box_income, use_container_width=True)
+            st.plotly_chart(figs['income'], use_container_width=True)
 
 
-    # 4. Interpretation/Discussion (Simplified English - Broken down by chart)
-    st.subheader("Interpretation/Discussion")
-    st.markdown(
-        """
-        **1. Average CGPA by Daily Social Media Usage:** This chart helps us see if too much screen time is hurting grades. If the average CGPA drops sharply for the "High" usage group, it suggests a need for better digital balance.
-        
-        **2. Average CGPA by Scholarship Status:** This shows whether students receiving merit-based aid perform better than those who do not. We generally expect scholarship recipients to have higher grades, confirming the merit system.
-        
-        **3. CGPA Distribution Across Income Groups:** The box plots let us compare the range of grades across different income groups. If the average grade is much lower for one group, it points to a need for more support or financial resources for those students.
-        """
+def page_3_non_academic():
+    render_page(
+        "Objective 3: Impact of Lifestyle and Daily Habits on Academic Performance 🌍",
+        lifestyle_metrics, OBJECTIVE_P3, lifestyle_charts, INTERPRETATION_P3
     )
 
 
 # --- MAIN APPLICATION ENTRY POINT ---
 def main():
-    # Load and clean data
-    df_filtered = load_and_clean_data(DATA_FILE)
-
-    if df_filtered.empty:
-        # Stop execution if data loading failed
-        return
-    
     # --- Set Streamlit Configuration ---
+    # First Streamlit call, so the page shell renders before the data is parsed
     st.set_page_config(
         page_title="Student Performance Analysis", # Browser Tab Title
         layout="wide",
         initial_sidebar_state="expanded"
     )
 
+    # Load and clean data
+    with st.spinner("Loading cohort data..."):
+        df_filtered = load_and_clean_data(DATA_FILE)
+
+    if df_filtered.empty:
+        # Stop execution if data loading failed; clearing the cached (empty) result
+        # makes the next run retry the load
+        load_and_clean_data.clear()
+        return
+
     # --- Page Navigation Setup ---
     PAGES = {
         "Objective 1: Performance Overview 🎓": page_1_overview,
@@ -418,7 +738,7 @@ def main():
     
     # Execute the selected page function
     page = PAGES[selection]
-    page(df_filtered)
+    page()
 
 if __name__ == "__main__":
     main()
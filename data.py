@@ -0,0 +1,135 @@
+"""
+Survey data shared by the homepage (home.py) and the StudentPerformance dashboard,
+plus the pre-aggregated box plot helpers both dashboards (StudentPerformance.py,
+app.py) draw their box plots with.
+"""
+import codecs
+
+import streamlit as st
+import pandas as pd
+import numpy as np
+import pyarrow as pa
+
+# --- CONSTANTS ---
+DATA_FILE = "Students_Performance_data_set.csv"
+# Bytes read to guess the file's encoding before the full parse
+ENCODING_SAMPLE_BYTES = 64 * 1024
+
+# Survey questions used anywhere in the dashboard, with their short names
+COLUMN_RENAME_MAP = {
+    'What is your current CGPA?': 'CGPA',
+    'Gender': 'Gender',
+    'How many hour do you study daily?': 'Study Hours per Day',
+    'How many times do you seat for study in a day?': 'Study Sessions per Day',
+    'Average attendance on class': 'Attendance',
+    'How many hour do you spent daily in social media?': 'Social Media Hours',
+    'Do you have meritorious scholarship ?': 'Scholarship Status',
+    'What is your monthly family income?': 'Family Income',
+    'Do you have personal Computer?': 'PC Status',
+    'Do you attend in teacher consultancy for any kind of academical problems?': 'Consultancy Status',
+    'Status of your English language proficiency': 'English Proficiency'
+}
+NUMERIC_COLUMNS = ['CGPA', 'Study Hours per Day', 'Study Sessions per Day', 'Social Media Hours', 'Family Income']
+CATEGORY_COLUMNS = ['Gender', 'Scholarship Status', 'PC Status', 'Consultancy Status', 'English Proficiency']
+
+# --- SHARED LOADER ---
+
+def read_survey_columns(file_path, encoding):
+    """Parses only the survey questions in COLUMN_RENAME_MAP, with PyArrow's CSV reader."""
+    header = pd.read_csv(file_path, nrows=0, encoding=encoding).columns
+    usecols = [col for col in header if col in COLUMN_RENAME_MAP]
+    return pd.read_csv(
+        file_path,
+        engine='pyarrow',
+        encoding=encoding,
+        usecols=usecols,
+        # Text columns as str, so undecodable bytes raise (Arrow would return them as raw bytes)
+        dtype={col: 'str' for col in usecols if COLUMN_RENAME_MAP[col] not in NUMERIC_COLUMNS}
+    )
+
+def sniff_encoding(file_path):
+    """
+    Guesses the CSV's encoding from its first ENCODING_SAMPLE_BYTES: 'utf-8' if
+    the sample decodes, otherwise 'latin1' (which maps every byte).
+    """
+    with open(file_path, 'rb') as f:
+        sample = f.read(ENCODING_SAMPLE_BYTES)
+    try:
+        # final=False: a multi-byte character cut off at the end of the sample is fine
+        codecs.getincrementaldecoder('utf-8')().decode(sample, final=False)
+        return 'utf-8'
+    except UnicodeDecodeError:
+        return 'latin1'
+
+# cache_resource hands every caller the same frame (no per-call copy like
+# cache_data), so callers must treat it as read-only: select columns or
+# assign into a new frame, never modify it in place.
+@st.cache_resource(show_spinner=False)
+def load_survey(file_path=DATA_FILE):
+    """Loads the survey CSV once per process, keeping only the renamed columns."""
+    # Load the dataset (the encoding is sniffed from a sample, not from failed full parses)
+    encoding = sniff_encoding(file_path)
+    try:
+        df = read_survey_columns(file_path, encoding)
+    except (UnicodeDecodeError, pa.ArrowInvalid):
+        # Non-UTF-8 bytes past the sample
+        df = read_survey_columns(file_path, 'latin1')
+
+    df = df.rename(columns=COLUMN_RENAME_MAP)
+    df = df[[col for col in COLUMN_RENAME_MAP.values() if col in df.columns]].copy()
+
+    # Shrink the shared frame: downcast numerics and store low-cardinality text as categories
+    for col in NUMERIC_COLUMNS:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors='coerce', downcast='float')
+    for col in CATEGORY_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+
+    return df
+
+
+# --- SHARED BOX PLOT HELPERS ---
+
+def box_stats(df, by, val, sort=True):
+    """
+    Quartiles, 1.5 IQR whisker ends and the points beyond them (the dots
+    px.box draws) of `val` per group of `by`, for pre-aggregated go.Box traces.
+    Groups come in group order, or in order of first appearance (the order
+    px.box uses) with sort=False.
+    """
+    def five_numbers(values):
+        values = values.dropna().to_numpy()
+        q1, median, q3 = np.percentile(values, [25, 50, 75])
+        iqr = q3 - q1
+        inside = (values >= q1 - 1.5 * iqr) & (values <= q3 + 1.5 * iqr)
+        return pd.Series({
+            'q1': q1, 'median': median, 'q3': q3,
+            'lowerfence': values[inside].min(),
+            'upperfence': values[inside].max(),
+            'outliers': values[~inside],
+        })
+    stats = df.groupby(by, observed=True, sort=sort)[val].apply(five_numbers).unstack()
+    # unstack sorts the groups again, so first-appearance order is restored afterwards
+    return stats if sort else stats.reindex(df[by].dropna().unique())
+
+def box_traces(stats, colors):
+    """
+    One go.Box per group (like px.box with color=...) plus a marker trace for
+    its outliers, built from box_stats output.
+    """
+    import plotly.graph_objects as go
+    traces = []
+    for (group, row), color in zip(stats.iterrows(), colors):
+        name = str(group)
+        traces.append(go.Box(
+            name=name, x=[name], marker_color=color, legendgroup=name,
+            q1=[row['q1']], median=[row['median']], q3=[row['q3']],
+            lowerfence=[row['lowerfence']], upperfence=[row['upperfence']]
+        ))
+        # Outlier dots, in the box's legend group so hiding one hides both
+        traces.append(go.Scatter(
+            x=[name] * len(row['outliers']), y=row['outliers'], mode='markers',
+            marker_color=color, name=name, legendgroup=name, showlegend=False
+        ))
+    return traces
@@ -1,89 +1,29 @@
 import streamlit as st
-import pandas as pd
-import numpy as np
 
-# --- CONSTANTS ---
-DATA_FILE = "Students_Performance_data_set.csv"
+from data import DATA_FILE, load_survey
+from plo_metrics import calculate_plo_metrics
 
 # --- UTILITY FUNCTION: DATA LOADING AND CLEANING ---
 
-# Cache the data loading for better performance
-@st.cache_data
 def load_and_clean_data(file_path):
-    """Loads, renames, cleans, and prepares the core student data."""
-    try:
-        df = pd.read_csv(file_path, encoding='utf-8')
-    except UnicodeDecodeError:
-        try:
-            df = pd.read_csv(file_path, encoding='latin1')
-        except UnicodeDecodeError:
-            df = pd.read_csv(file_path, encoding='cp1252')
-            
-    # Define a dictionary for renaming relevant columns
-    column_rename_map = {
-        'What is your current CGPA?': 'CGPA',
-        'Do you have personal Computer?': 'PC Status',
-        'Do you attend in teacher consultancy for any kind of academical problems?': 'Consultancy Status',
-        'Status of your English language proficiency': 'English Proficiency'
-    }
-    df.rename(columns=column_rename_map, inplace=True)
-    
-    # Ensure CGPA is numeric
-    df['CGPA'] = pd.to_numeric(df['CGPA'], errors='coerce')
-    
-    return df
-
-# --- PLO Metric Calculation Function ---
-
-def calculate_plo_metrics(df):
-    """Calculates the PLO metric values."""
-    
-    # 1. PLO 2: Cognitive Skill (Mean CGPA)
-    plo2_value = df['CGPA'].mean()
-
-    # 2. PLO 3: Digital Skill (PC Ownership Percentage)
-    if 'PC Status' in df.columns:
-        df['PC Status_Binary'] = df['PC Status'].astype(str).str.lower().map({'yes': 1, 'no': 0})
-        plo3_value = df['PC Status_Binary'].mean() * 100
-    else:
-        plo3_value = np.nan 
-
-    # 3. PLO 4: Interpersonal Skill (Consultancy Attendance Percentage)
-    if 'Consultancy Status' in df.columns:
-        df['Consultancy Status_Binary'] = df['Consultancy Status'].astype(str).str.lower().map({'yes': 1, 'no': 0})
-        plo4_value = df['Consultancy Status_Binary'].mean() * 100
-    else:
-        plo4_value = np.nan
-
-    # 4. PLO 5: Communication Skill (Average English Proficiency Score)
-    proficiency_map = {'basic': 1, 'intermediate': 2, 'advance': 3, 'advanced': 3}
-    if 'English Proficiency' in df.columns:
-        df['English Proficiency_Score'] = df['English Proficiency'].astype(str).str.lower().map(proficiency_map)
-        plo5_value = df['English Proficiency_Score'].mean()
-    else:
-        plo5_value = np.nan
-
-    # --- Final Formatting ---
-    plo2_formatted = f"{plo2_value:.2f}" if not np.isnan(plo2_value) else "N/A"
-    plo3_formatted = f"{plo3_value:.1f}%" if not np.isnan(plo3_value) else "N/A"
-    plo4_formatted = f"{plo4_value:.1f}%" if not np.isnan(plo4_value) else "N/A"
-    plo5_formatted = f"{plo5_value:.2f}" if not np.isnan(plo5_value) else "N/A"
-    
-    return plo2_formatted, plo3_formatted, plo4_formatted, plo5_formatted
+    """Returns the PLO columns of the shared survey frame (see data.py)."""
+    df = load_survey(file_path)
+    return df[[col for col in ['CGPA', 'PC Status', 'Consultancy Status', 'English Proficiency'] if col in df.columns]]
 
 # --- MAIN HOMEPAGE LOGIC ---
 
 def main():
+    # First Streamlit call, so the page shell renders before the data is parsed
+    st.set_page_config(
+        page_title="Student Performance Dashboard", 
+        layout="wide"
+    )
+
     # Load and clean data
     df = load_and_clean_data(DATA_FILE)
     
     # Calculate PLO metrics
     plo2_val, plo3_val, plo4_val, plo5_val = calculate_plo_metrics(df)
-    
-    st.set_page_config(
-        page_title="Student Performance Dashboard", 
-        layout="wide"
-    )
 
     # --- Homepage Content ---
     st.title("📊 Student Performance Analysis Dashboard")
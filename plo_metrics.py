@@ -0,0 +1,54 @@
+"""Program Learning Outcome (PLO) metrics shown on the dashboard homepage."""
+import streamlit as st
+import numpy as np
+
+# --- PLO Metric Calculation Function ---
+
+def category_mean(series, value_map):
+    """
+    Averages `value_map` (keyed by lower-cased answer) over a column by scoring
+    each category once and gathering the scores through the category codes.
+    Answers missing from `value_map` count as NaN, like Series.map would.
+    """
+    cats = series.astype('category').cat
+    scores = [value_map.get(str(c).lower(), np.nan) for c in cats.categories]
+    # Trailing NaN catches code -1 (missing values)
+    scores = np.array(scores + [np.nan], dtype=float)
+    return np.nanmean(scores[cats.codes.to_numpy()])
+
+# Cached so the four metrics are computed once per loaded dataset
+@st.cache_data
+def calculate_plo_metrics(df):
+    """Calculates the PLO metric values."""
+    
+    # 1. PLO 2: Cognitive Skill (Mean CGPA)
+    plo2_value = df['CGPA'].mean()
+
+    yes_no_map = {'yes': 1, 'no': 0}
+
+    # 2. PLO 3: Digital Skill (PC Ownership Percentage)
+    if 'PC Status' in df.columns:
+        plo3_value = category_mean(df['PC Status'], yes_no_map) * 100
+    else:
+        plo3_value = np.nan 
+
+    # 3. PLO 4: Interpersonal Skill (Consultancy Attendance Percentage)
+    if 'Consultancy Status' in df.columns:
+        plo4_value = category_mean(df['Consultancy Status'], yes_no_map) * 100
+    else:
+        plo4_value = np.nan
+
+    # 4. PLO 5: Communication Skill (Average English Proficiency Score)
+    proficiency_map = {'basic': 1, 'intermediate': 2, 'advance': 3, 'advanced': 3}
+    if 'English Proficiency' in df.columns:
+        plo5_value = category_mean(df['English Proficiency'], proficiency_map)
+    else:
+        plo5_value = np.nan
+
+    # --- Final Formatting ---
+    plo2_formatted = f"{plo2_value:.2f}" if not np.isnan(plo2_value) else "N/A"
+    plo3_formatted = f"{plo3_value:.1f}%" if not np.isnan(plo3_value) else "N/A"
+    plo4_formatted = f"{plo4_value:.1f}%" if not np.isnan(plo4_value) else "N/A"
+    plo5_formatted = f"{plo5_value:.2f}" if not np.isnan(plo5_value) else "N/A"
+    
+    return plo2_formatted, plo3_formatted, plo4_formatted, plo5_formatted
@@ -0,0 +1,23 @@
+"""
+Build step for StudentPerformance.py: runs the cleaning pipeline once and
+writes the result to the Arrow IPC (Feather) snapshot the dashboard reads
+on startup. The dashboard also rebuilds it on its own when the raw CSV is
+newer, so this is only needed to warm the snapshot ahead of a deploy.
+
+Run it whenever the raw CSV changes:
+    python prepare_data.py
+"""
+from StudentPerformance import (
+    CLEAN_DATA_FILE,
+    DATA_FILE,
+    write_clean_snapshot,
+)
+
+
+def main():
+    df = write_clean_snapshot(DATA_FILE)
+    print(f"Wrote {len(df)} rows to {CLEAN_DATA_FILE}")
+
+
+if __name__ == "__main__":
+    main()
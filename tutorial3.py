@@ -1,25 +1,34 @@
 
+import os
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.express as px
+import plotly.graph_objects as go
 import requests
-from io import StringIO
+import urllib3
 
 # --- Configuration and Data Loading ---
 st.set_page_config(layout="wide", page_title="Arts Faculty Data Analysis (with Insights)")
 
-# Data source URL
+# Data source: the CSV shipped next to this script, with GitHub as a fallback
+DATA_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "arts_faculty_data.csv")
 URL = "https://raw.githubusercontent.com/syahadira/S22A0053/refs/heads/main/arts_faculty_data.csv"
 
 @st.cache_data
-def load_data(url):
-    """Fetches and caches the data from the GitHub URL."""
+def load_data(url, file_path=DATA_FILE):
+    """Loads and caches the data, reading the local copy when it exists."""
+    # Reading from disk avoids a network round-trip on every cold start
+    if os.path.exists(file_path):
+        return pd.read_csv(file_path)
     try:
-        response = requests.get(url)
-        response.raise_for_status() # Check for request errors
-        data = pd.read_csv(StringIO(response.text))
+        # Stream the body straight into the CSV parser instead of holding it in memory first
+        with requests.get(url, timeout=10, stream=True) as response:
+            response.raise_for_status() # Check for request errors
+            response.raw.decode_content = True # Undo gzip transfer encoding while streaming
+            data = pd.read_csv(response.raw)
         return data
-    except requests.exceptions.RequestException as e:
+    except (requests.exceptions.RequestException, urllib3.exceptions.HTTPError) as e:
         st.error(f"Error fetching data: {e}")
         return pd.DataFrame() # Return an empty DataFrame on error
 
@@ -37,45 +46,73 @@ st.dataframe(arts_faculty_df.head(), use_container_width=True)
 
 st.markdown("---")
 
+# --- Count Tables (computed once, shared by the figures) ---
+
+def count_genders(df):
+    """Gender counts, largest first (the order value_counts gives), from one np.unique pass."""
+    genders, counts = np.unique(df['Gender'].dropna().to_numpy(dtype=str), return_counts=True)
+    order = np.argsort(-counts, kind='stable')
+    return pd.DataFrame({'Gender': genders[order], 'Count': counts[order]})
+
+@st.cache_data(show_spinner=False)
+def summarize_counts(df):
+    """Small count tables for the count charts, so each figure reads a few rows instead of the full frame."""
+    return {
+        'gender': count_genders(df),
+        'modality_by_gender': df.groupby(['Classes are mostly', 'Gender']).size().reset_index(name='Count'),
+        # sort=False keeps first-appearance order, the bar order px.histogram used
+        'program': df['Arts Program'].value_counts(sort=False).reset_index(),
+        'modality': df['Classes are mostly'].value_counts(sort=False).reset_index(),
+    }
+
 # --- Visualization Functions (using Plotly Express) ---
+# Each figure only depends on the cached data, so the builders are cached
+# too: reruns get the same Figure object back instead of rebuilding it.
 
 # 1. Gender Distribution (Pie Chart)
-def plot_gender_pie(df):
-    """Creates an interactive Pie Chart for Gender Distribution."""
-    gender_counts = df['Gender'].value_counts().reset_index()
-    gender_counts.columns = ['Gender', 'Count']
-    fig = px.pie(
-        gender_counts,
-        values='Count',
-        names='Gender',
-        title='1. Gender Distribution (Pie Chart)',
-        color_discrete_sequence=px.colors.qualitative.Pastel
+@st.cache_resource(show_spinner=False)
+def plot_gender_pie(gender_counts):
+    """Creates an interactive Pie Chart for Gender Distribution (a go.Pie straight from the count table)."""
+    fig = go.Figure(
+        data=[go.Pie(
+            labels=gender_counts['Gender'].tolist(),
+            values=gender_counts['Count'].tolist(),
+            marker_colors=px.colors.qualitative.Pastel,
+            textposition='inside',
+            textinfo='percent+label'
+        )],
+        layout={'title': '1. Gender Distribution (Pie Chart)'}
     )
-    fig.update_traces(textposition='inside', textinfo='percent+label')
     return fig
 
 # 2. Gender Distribution (Bar Chart)
-def plot_gender_bar(df):
-    """Creates an interactive Bar Chart for Gender Distribution."""
-    gender_counts = df['Gender'].value_counts().reset_index()
-    gender_counts.columns = ['Gender', 'Count']
-    fig = px.bar(
-        gender_counts,
-        x='Gender',
-        y='Count',
-        title='2. Gender Distribution (Bar Chart)',
-        color='Gender',
-        color_discrete_sequence=['#A84C4C', '#4C78A8']
+@st.cache_resource(show_spinner=False)
+def plot_gender_bar(gender_counts):
+    """Creates an interactive Bar Chart for Gender Distribution (one go.Bar, coloured per gender)."""
+    colors = ['#A84C4C', '#4C78A8']
+    fig = go.Figure(
+        data=[go.Bar(
+            x=gender_counts['Gender'].tolist(),
+            y=gender_counts['Count'].tolist(),
+            marker_color=[colors[i % len(colors)] for i in range(len(gender_counts))]
+        )],
+        layout={
+            'title': '2. Gender Distribution (Bar Chart)',
+            'xaxis': {'title': 'Gender'},
+            'yaxis': {'title': 'Count'},
+            'showlegend': False
+        }
     )
-    fig.update_layout(showlegend=False)
     return fig
 
 # 3. Arts Program Distribution
-def plot_arts_program_distribution(df):
+@st.cache_resource(show_spinner=False)
+def plot_arts_program_distribution(program_counts):
     """Creates an interactive Bar Chart for Arts Program Enrollment."""
-    fig = px.histogram(
-        df,
+    fig = px.bar(
+        program_counts,
         x='Arts Program',
+        y='count',
         title='3. Distribution of Arts Programs',
         labels={'Arts Program': 'Arts Program', 'count': 'Count'},
         color_discrete_sequence=['#4C78A8']
@@ -84,25 +121,67 @@ def plot_arts_program_distribution(df):
     return fig
 
 # 4. & 5. GPA Distributions (Histograms)
-def plot_gpa_histogram(df, column_name, plot_number):
-    """Creates an interactive Histogram for GPA distribution."""
-    fig = px.histogram(
-        df,
-        x=column_name,
-        nbins=20,
-        marginal="box", # Adds a box plot for summary statistics
+@st.cache_resource(show_spinner=False)
+def plot_gpa_histogram(values, column_name, plot_number):
+    """
+    Creates an interactive Histogram for GPA distribution. The bins and the
+    box plot's quartiles are computed here with NumPy, so only the 20 bar
+    heights and a few summary numbers are sent to the browser. Takes the
+    column as a float array, so the cache key hashes one column's bytes
+    instead of the whole frame.
+    """
+    values = values[~np.isnan(values)]
+    if values.size == 0:
+        # Nothing to bin or summarize (np.percentile would raise): an empty chart, as px.histogram drew
+        fig = go.Figure(go.Bar(x=[], y=[], marker_color='#F58518', name=column_name))
+        fig.update_layout(
+            title=f'{plot_number}. Distribution of {column_name}',
+            xaxis_title=column_name, yaxis_title='Frequency', showlegend=False
+        )
+        return fig
+    counts, edges = np.histogram(values, bins=20)
+    fig = go.Figure(go.Bar(
+        x=(edges[:-1] + edges[1:]) / 2,
+        y=counts,
+        width=np.diff(edges),
+        marker_color='#F58518',
+        name=column_name
+    ))
+
+    # Adds a box plot for summary statistics (above the bars, like px's marginal="box")
+    q1, median, q3 = np.percentile(values, [25, 50, 75])
+    iqr = q3 - q1
+    inside = values[(values >= q1 - 1.5 * iqr) & (values <= q3 + 1.5 * iqr)]
+    outliers = values[(values < q1 - 1.5 * iqr) | (values > q3 + 1.5 * iqr)]
+    fig.add_trace(go.Box(
+        q1=[q1], median=[median], q3=[q3],
+        lowerfence=[inside.min()], upperfence=[inside.max()],
+        y=[column_name], orientation='h',
+        marker_color='#F58518', name=column_name,
+        xaxis='x2', yaxis='y2'
+    ))
+    fig.add_trace(go.Scatter(
+        x=outliers, y=[column_name] * len(outliers), mode='markers',
+        marker_color='#F58518', name=column_name,
+        xaxis='x2', yaxis='y2'
+    ))
+
+    fig.update_layout(
         title=f'{plot_number}. Distribution of {column_name}',
-        color_discrete_sequence=['#F58518']
+        xaxis_title=column_name, yaxis_title='Frequency',
+        yaxis={'domain': [0.0, 0.8316]},
+        xaxis2={'anchor': 'y2', 'matches': 'x', 'showticklabels': False},
+        yaxis2={'domain': [0.8416, 1.0], 'showticklabels': False},
+        bargap=0, showlegend=False
     )
-    fig.update_layout(xaxis_title=column_name, yaxis_title='Frequency')
     return fig
 
 # 6. Modality by Gender
-def plot_modality_by_gender(df):
+@st.cache_resource(show_spinner=False)
+def plot_modality_by_gender(modality_by_gender):
     """Creates an interactive Grouped Bar Chart for Class Modality by Gender."""
-    df_plot = df.groupby(['Classes are mostly', 'Gender']).size().reset_index(name='Count')
     fig = px.bar(
-        df_plot,
+        modality_by_gender,
         x='Classes are mostly',
         y='Count',
         color='Gender',
@@ -114,67 +193,96 @@ def plot_modality_by_gender(df):
     return fig
 
 # 7. Overall Modality Distribution
-def plot_overall_modality(df):
-    """Creates an interactive Histogram for Overall Class Modality."""
-    fig = px.histogram(
-        df,
-        x='Classes are mostly',
-        title='7. Overall Distribution of Class Modality',
-        color_discrete_sequence=['#5BA04F']
+@st.cache_resource(show_spinner=False)
+def plot_overall_modality(modality_counts):
+    """Creates an interactive Bar Chart for Overall Class Modality (a go.Bar straight from the count table)."""
+    fig = go.Figure(
+        data=[go.Bar(
+            x=modality_counts['Classes are mostly'].tolist(),
+            y=modality_counts['count'].tolist(),
+            marker_color='#5BA04F'
+        )],
+        layout={
+            'title': '7. Overall Distribution of Class Modality',
+            'xaxis': {'title': 'Classes are mostly', 'tickangle': 45},
+            'yaxis': {'title': 'count'}
+        }
     )
-    fig.update_xaxes(tickangle=45)
     return fig
 
 
+# --- Insight Text (one entry per chart, built once at import) ---
+
+INSIGHTS = (
+    "**Insight (1):** The pie chart clearly shows a **gender imbalance**, with a much higher percentage of students being **female**. This is typical for many Arts and Humanities faculties. It means the university should design student services and campus facilities to meet the needs of the larger female student population.",
+    "**Insight (2):** This bar chart confirms the **large numerical difference** between male and female students. For every male student, there are roughly two female students enrolled. This highlights the need to understand why male enrollment is lower and potentially develop strategies to balance the distribution.",
+    "**Insight (3):** The bar chart reveals the **popularity of different Arts programs**. Some programs have significantly higher student counts than others, leading to an unequal workload across departments. This information is vital for the faculty when deciding where to allocate teaching staff and classroom space.",
+    "**Insight (4):** The S.S.C GPA distribution is **skewed towards the higher grades** (likely 4.0 and 5.0). This shows that most students entering the faculty have a **strong academic foundation** from their initial secondary school years. The school is generally admitting high-achieving applicants.",
+    "**Insight (5):** The H.S.C GPA distribution is also heavily concentrated at the **high end of the scale**. This pattern confirms that the student body maintained **excellent grades** throughout their senior high school years. The faculty has a pool of students well-prepared for university-level coursework.",
+    "**Insight (6):** This chart compares class preference by gender. It shows if **females and males prefer different learning styles** (Online, Offline, or Hybrid). This helps the faculty understand if specific course formats are favored by one gender, which can affect student participation and performance.",
+    "**Insight (7):** This overall chart clearly identifies the **most popular class modality** among all students. The highest bar indicates the teaching method most widely used or preferred. This allows administrators to focus resources and training on the dominant mode of instruction.",
+)
+
 # --- Layout and Plotting (7 Separated Visualizations with Insights) ---
+# Each section is a fragment: a widget added inside one later reruns only
+# that section, not the other charts on the page.
+
+@st.fragment
+def render_gender_section(gender_counts):
+    """Charts 1 and 2 with their insights, side by side."""
+    col_pie, col_bar = st.columns(2)
+    with col_pie:
+        st.plotly_chart(plot_gender_pie(gender_counts), use_container_width=True)
+        st.markdown(INSIGHTS[0])
+    with col_bar:
+        st.plotly_chart(plot_gender_bar(gender_counts), use_container_width=True)
+        st.markdown(INSIGHTS[1])
+
+@st.fragment
+def render_program_section(program_counts):
+    """Chart 3 with its insight, full width."""
+    st.plotly_chart(plot_arts_program_distribution(program_counts), use_container_width=True)
+    st.markdown(INSIGHTS[2])
+
+@st.fragment
+def render_gpa_section(df):
+    """Charts 4 and 5 with their insights, side by side."""
+    col_ssc, col_hsc = st.columns(2)
+    with col_ssc:
+        st.plotly_chart(plot_gpa_histogram(df['S.S.C (GPA)'].to_numpy(dtype=float), 'S.S.C (GPA)', '4'), use_container_width=True)
+        st.markdown(INSIGHTS[3])
+    with col_hsc:
+        st.plotly_chart(plot_gpa_histogram(df['H.S.C (GPA)'].to_numpy(dtype=float), 'H.S.C (GPA)', '5'), use_container_width=True)
+        st.markdown(INSIGHTS[4])
+
+@st.fragment
+def render_modality_section(modality_by_gender, modality_counts):
+    """Charts 6 and 7 with their insights, side by side."""
+    col_gender_modality, col_overall_modality = st.columns(2)
+    with col_gender_modality:
+        st.plotly_chart(plot_modality_by_gender(modality_by_gender), use_container_width=True)
+        st.markdown(INSIGHTS[5])
+    with col_overall_modality:
+        st.plotly_chart(plot_overall_modality(modality_counts), use_container_width=True)
+        st.markdown(INSIGHTS[6])
+
+
+counts = summarize_counts(arts_faculty_df)
 
 # Removed st.header("1. Gender Demographics")
-col_pie, col_bar = st.columns(2)
-with col_pie:
-    st.plotly_chart(plot_gender_pie(arts_faculty_df), use_container_width=True)
-    st.markdown("""
-        **Insight (1):** The pie chart clearly shows a **gender imbalance**, with a much higher percentage of students being **female**. This is typical for many Arts and Humanities faculties. It means the university should design student services and campus facilities to meet the needs of the larger female student population.
-    """)
-with col_bar:
-    st.plotly_chart(plot_gender_bar(arts_faculty_df), use_container_width=True)
-    st.markdown("""
-        **Insight (2):** This bar chart confirms the **large numerical difference** between male and female students. For every male student, there are roughly two female students enrolled. This highlights the need to understand why male enrollment is lower and potentially develop strategies to balance the distribution.
-    """)
+render_gender_section(counts['gender'])
 
 st.markdown("---")
 
 # Removed st.header("2. Program Enrollment")
-st.plotly_chart(plot_arts_program_distribution(arts_faculty_df), use_container_width=True)
-st.markdown("""
-    **Insight (3):** The bar chart reveals the **popularity of different Arts programs**. Some programs have significantly higher student counts than others, leading to an unequal workload across departments. This information is vital for the faculty when deciding where to allocate teaching staff and classroom space.
-""")
+render_program_section(counts['program'])
 
 st.markdown("---")
 
 # Removed st.header("3. Academic Performance (GPA)")
-col_ssc, col_hsc = st.columns(2)
-with col_ssc:
-    st.plotly_chart(plot_gpa_histogram(arts_faculty_df, 'S.S.C (GPA)', '4'), use_container_width=True)
-    st.markdown("""
-        **Insight (4):** The S.S.C GPA distribution is **skewed towards the higher grades** (likely 4.0 and 5.0). This shows that most students entering the faculty have a **strong academic foundation** from their initial secondary school years. The school is generally admitting high-achieving applicants.
-    """)
-with col_hsc:
-    st.plotly_chart(plot_gpa_histogram(arts_faculty_df, 'H.S.C (GPA)', '5'), use_container_width=True)
-    st.markdown("""
-        **Insight (5):** The H.S.C GPA distribution is also heavily concentrated at the **high end of the scale**. This pattern confirms that the student body maintained **excellent grades** throughout their senior high school years. The faculty has a pool of students well-prepared for university-level coursework.
-    """)
+render_gpa_section(arts_faculty_df)
 
 st.markdown("---")
 
 # Removed st.header("4. Class Modality Preferences")
-col_gender_modality, col_overall_modality = st.columns(2)
-with col_gender_modality:
-    st.plotly_chart(plot_modality_by_gender(arts_faculty_df), use_container_width=True)
-    st.markdown("""
-        **Insight (6):** This chart compares class preference by gender. It shows if **females and males prefer different learning styles** (Online, Offline, or Hybrid). This helps the faculty understand if specific course formats are favored by one gender, which can affect student participation and performance.
-    """)
-with col_overall_modality:
-    st.plotly_chart(plot_overall_modality(arts_faculty_df), use_container_width=True)
-    st.markdown("""
-        **Insight (7):** This overall chart clearly identifies the **most popular class modality** among all students. The highest bar indicates the teaching method most widely used or preferred. This allows administrators to focus resources and training on the dominant mode of instruction.
-    """)
+render_modality_section(counts['modality_by_gender'], counts['modality'])